@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TilsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "TILs"
+
+    def ready(self):
+        import TILs.signals
@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+from TILs.models import TIL
+from TILs.tasks import render_til_content_task
+
+
+class Command(BaseCommand):
+    help = "렌더링 결과가 없는 TIL의 Markdown 본문을 HTML과 요약으로 변환합니다."
+
+    def handle(self, *args, **options):
+        til_ids = TIL.objects.filter(content_hash="").values_list("id", flat=True)
+        count = 0
+        for til_id in til_ids.iterator():
+            render_til_content_task(til_id)
+            count += 1
+        self.stdout.write(self.style.SUCCESS(f"{count}개의 TIL을 렌더링했습니다."))
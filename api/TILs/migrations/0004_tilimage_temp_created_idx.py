@@ -0,0 +1,17 @@
+# Generated by Django 5.1 on 2026-10-19 18:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('TILs', '0003_rename_til_tilimage_til'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tilimage',
+            index=models.Index(condition=models.Q(('TIL__isnull', True), ('is_temporary', True)), fields=['created_at'], name='tilimage_temp_created_idx'),
+        ),
+    ]
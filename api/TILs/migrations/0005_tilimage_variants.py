@@ -0,0 +1,18 @@
+# Generated by Django 5.1 on 2026-10-19 18:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('TILs', '0004_tilimage_temp_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='tilimage',
+            name='variants',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.1 on 2026-10-19 18:04
+
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+# title, content 가 바뀔 때만 search_vector 를 다시 계산하는 트리거
+SEARCH_VECTOR_TRIGGER_SQL = """
+CREATE FUNCTION tils_til_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('simple', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(NEW.content, '')), 'B');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER tils_til_search_vector_trigger
+BEFORE INSERT OR UPDATE OF title, content ON "TILs_til"
+FOR EACH ROW EXECUTE FUNCTION tils_til_search_vector_update();
+
+UPDATE "TILs_til" SET search_vector =
+    setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce(content, '')), 'B');
+"""
+
+DROP_SEARCH_VECTOR_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS tils_til_search_vector_trigger ON "TILs_til";
+DROP FUNCTION IF EXISTS tils_til_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('TILs', '0005_tilimage_variants'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='til',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(
+            SEARCH_VECTOR_TRIGGER_SQL,
+            reverse_sql=DROP_SEARCH_VECTOR_TRIGGER_SQL,
+        ),
+    ]
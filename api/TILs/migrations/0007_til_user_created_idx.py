@@ -0,0 +1,19 @@
+# Generated by Django 5.1 on 2026-10-19 18:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('TILs', '0006_til_search_vector'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='til',
+            index=models.Index(fields=['user', '-created_at', '-id'], name='til_user_created_idx'),
+        ),
+    ]
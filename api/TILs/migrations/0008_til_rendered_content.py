@@ -0,0 +1,28 @@
+# Generated by Django 5.1 on 2026-10-19 18:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('TILs', '0007_til_user_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='til',
+            name='content_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='til',
+            name='excerpt',
+            field=models.CharField(blank=True, editable=False, max_length=200),
+        ),
+        migrations.AddField(
+            model_name='til',
+            name='rendered_html',
+            field=models.TextField(blank=True, editable=False),
+        ),
+    ]
@@ -0,0 +1,19 @@
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+    # 배포 중에 TIL 쓰기가 막히지 않도록 트랜잭션 밖에서 인덱스를 동시에 만든다.
+    atomic = False
+
+    dependencies = [
+        ('TILs', '0008_til_rendered_content'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='til',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='til_search_vector_gin'),
+        ),
+    ]
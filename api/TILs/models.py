@@ -1,4 +1,6 @@
 from common.models import TimeStampModel
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
 from users.models import User
 
@@ -7,6 +9,21 @@ class TIL(TimeStampModel):
     user = models.ForeignKey(User, on_delete=models.CASCADE, null=False)
     title = models.CharField(max_length=250, null=False)
     content = models.TextField(null=False)
+    # 본문 Markdown 렌더링 결과 캐시 (content_hash 가 현재 본문과 같을 때만 유효)
+    content_hash = models.CharField(max_length=64, blank=True, editable=False)
+    rendered_html = models.TextField(blank=True, editable=False)
+    excerpt = models.CharField(max_length=200, blank=True, editable=False)
+    # 제목/내용 전문 검색용 벡터. DB 트리거가 title, content 변경 시 갱신한다.
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="til_search_vector_gin"),
+            # 사용자별 TIL 목록 커서 페이지네이션용
+            models.Index(
+                fields=["user", "-created_at", "-id"], name="til_user_created_idx"
+            ),
+        ]
 
 
 class TILImage(TimeStampModel):
@@ -15,6 +32,18 @@ class TILImage(TimeStampModel):
     )
     image = models.URLField(max_length=500, null=False)  # S3 URL을 직접 저장
     is_temporary = models.BooleanField(default=True)
+    # 썸네일 등 리사이즈된 이미지 URL ({"thumbnail": url, "medium": url, "webp": url})
+    variants = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        indexes = [
+            # 오래된 임시 이미지 정리 작업용 부분 인덱스
+            models.Index(
+                fields=["created_at"],
+                condition=models.Q(is_temporary=True, TIL__isnull=True),
+                name="tilimage_temp_created_idx",
+            ),
+        ]
 
     @property
     def image_url(self):
@@ -0,0 +1,80 @@
+import hashlib
+import re
+from html import escape, unescape
+from urllib.parse import urlparse
+
+import markdown
+from markdown.extensions import Extension
+from markdown.treeprocessors import Treeprocessor
+
+EXCERPT_LENGTH = 200  # 목록/피드에 보여줄 요약 글자 수
+SAFE_URL_SCHEMES = ("", "http", "https", "mailto")
+# 검색 결과 하이라이트 구분자. 본문에 나오지 않는 사용자 정의 영역 문자를 사용
+HEADLINE_START_SEL = "\ue000"
+HEADLINE_STOP_SEL = "\ue001"
+MARKDOWN_EXTENSIONS = ["fenced_code", "tables", "sane_lists"]
+
+
+def is_safe_url(url):
+    # 브라우저는 스킴 앞뒤의 공백/제어 문자를 무시하므로 제거한 뒤 스킴을 확인
+    normalized = re.sub(r"[\x00-\x20]", "", unescape(url))
+    return urlparse(normalized).scheme.lower() in SAFE_URL_SCHEMES
+
+
+class SafeUrlTreeprocessor(Treeprocessor):
+    # javascript: 처럼 허용하지 않는 스킴의 링크/이미지 주소를 제거
+    def run(self, root):
+        for element in root.iter():
+            for attribute in ("href", "src"):
+                url = element.get(attribute)
+                if url is not None and not is_safe_url(url):
+                    del element.attrib[attribute]
+
+
+class SafeMarkdownExtension(Extension):
+    def extendMarkdown(self, md):
+        # 본문에 포함된 HTML 태그는 그대로 출력하지 않고 이스케이프
+        md.preprocessors.deregister("html_block")
+        md.inlinePatterns.deregister("html")
+        md.treeprocessors.register(SafeUrlTreeprocessor(md), "safe_url", 0)
+
+
+def get_content_hash(content):
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def make_excerpt(html):
+    text = unescape(re.sub(r"<[^>]+>", " ", html))
+    text = " ".join(text.split())
+    if len(text) > EXCERPT_LENGTH:
+        return text[: EXCERPT_LENGTH - 1].rstrip() + "…"
+    return text
+
+
+def render_markdown(content):
+    """
+    TIL 본문(Markdown)을 HTML로 변환하고 (HTML, 일반 텍스트 요약)을 반환한다.
+    """
+    html = markdown.markdown(
+        content, extensions=[*MARKDOWN_EXTENSIONS, SafeMarkdownExtension()]
+    )
+    return html, make_excerpt(html)
+
+
+def highlight_headline(headline):
+    """
+    SearchHeadline 결과(원본 Markdown 일부)를 이스케이프한 뒤 일치한 부분만 <mark> 로 감싼다.
+    본문에 포함된 HTML 은 그대로 출력되지 않고, 짝이 맞지 않는 구분자는 버린다.
+    """
+    if not headline:
+        return headline
+    parts = []
+    position = 0
+    pattern = re.escape(HEADLINE_START_SEL) + "(.*?)" + re.escape(HEADLINE_STOP_SEL)
+    for match in re.finditer(pattern, headline, re.S):
+        parts.append(escape(headline[position : match.start()]))
+        parts.append(f"<mark>{escape(match.group(1))}</mark>")
+        position = match.end()
+    parts.append(escape(headline[position:]))
+    html = "".join(parts)
+    return html.replace(HEADLINE_START_SEL, "").replace(HEADLINE_STOP_SEL, "")
@@ -1,12 +1,16 @@
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
 from .models import TIL
+from .rendering import get_content_hash, highlight_headline, render_markdown
+from .utils import PRESIGNED_IMAGE_EXTENSIONS
 
 
 class TILListSerializer(serializers.ModelSerializer):
     class Meta:
         model = TIL
-        fields = ["id", "title", "created_at"]
+        fields = ["id", "title", "excerpt", "created_at"]
 
 
 class TILDetailSerializer(serializers.ModelSerializer):
@@ -14,7 +18,100 @@ class TILDetailSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = TIL
-        fields = ["id", "title", "content", "created_at", "images"]
+        fields = [
+            "id",
+            "title",
+            "content",
+            "rendered_html",
+            "excerpt",
+            "created_at",
+            "images",
+        ]
+        read_only_fields = ["rendered_html", "excerpt"]
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # 비동기 렌더링이 아직 끝나지 않아 저장된 결과가 현재 본문과 다르면 즉시 렌더링
+        if instance.content_hash != get_content_hash(instance.content):
+            data["rendered_html"], data["excerpt"] = render_markdown(instance.content)
+        return data
 
     def get_images(self, obj):
-        return [{"id": image.id, "url": image.image} for image in obj.images.all()]
+        return [
+            {"id": image.id, "url": image.image, "variants": image.variants}
+            for image in obj.images.all()
+        ]
+
+
+class TILFeedSerializer(serializers.ModelSerializer):
+    nickname = serializers.CharField(source="user.nickname", read_only=True)
+
+    class Meta:
+        model = TIL
+        fields = ["id", "title", "excerpt", "nickname", "created_at"]
+
+
+class TILFeedResponseSerializer(serializers.Serializer):
+    results = TILFeedSerializer(many=True)
+    next_cursor = serializers.IntegerField(allow_null=True)
+
+
+class TILSearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=200)
+    nickname = serializers.CharField(required=False)
+    start_date = serializers.DateField(required=False)
+    end_date = serializers.DateField(required=False)
+
+    def validate(self, attrs):
+        start_date = attrs.get("start_date")
+        end_date = attrs.get("end_date")
+        if start_date and end_date and start_date > end_date:
+            raise serializers.ValidationError(
+                "시작 날짜는 종료 날짜보다 이후일 수 없습니다."
+            )
+        return attrs
+
+
+class TILSearchSerializer(serializers.ModelSerializer):
+    nickname = serializers.CharField(source="user.nickname", read_only=True)
+    rank = serializers.FloatField(read_only=True)
+    headline = serializers.SerializerMethodField()
+
+    class Meta:
+        model = TIL
+        fields = ["id", "title", "nickname", "created_at", "rank", "headline"]
+
+    @extend_schema_field(OpenApiTypes.STR)
+    def get_headline(self, obj):
+        # 일치한 부분만 <mark> 로 감싼 이스케이프된 HTML
+        return highlight_headline(obj.headline)
+
+
+class PresignedImageFileSerializer(serializers.Serializer):
+    # 원본 파일 이름은 S3 키에 사용하지 않는다.
+    file_name = serializers.CharField(max_length=200, required=False)
+    content_type = serializers.CharField(max_length=100)
+
+    def validate_content_type(self, value):
+        if value not in PRESIGNED_IMAGE_EXTENSIONS:
+            raise serializers.ValidationError(
+                f"허용되지 않는 이미지 형식입니다. ({', '.join(PRESIGNED_IMAGE_EXTENSIONS)})"
+            )
+        return value
+
+
+class PresignedImageUploadSerializer(serializers.Serializer):
+    MAX_FILES = 10
+
+    files = PresignedImageFileSerializer(many=True)
+
+    def validate_files(self, value):
+        if not value:
+            raise serializers.ValidationError(
+                "업로드할 파일 정보가 제공되지 않았습니다."
+            )
+        if len(value) > self.MAX_FILES:
+            raise serializers.ValidationError(
+                f"한 번에 최대 {self.MAX_FILES}개까지 업로드할 수 있습니다."
+            )
+        return value
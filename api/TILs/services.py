@@ -0,0 +1,167 @@
+from common.catalog_cache import CacheVersion
+from common.redis_client import get_redis
+from django.conf import settings
+from django.db import transaction
+from follows.models import Follow
+
+from .models import TIL
+
+
+class FeedService:
+    """
+    팔로우한 사용자들의 TIL 피드.
+    일반 작성자의 TIL은 작성 시점에 팔로워별 Redis 타임라인(sorted set)에 넣어 두고,
+    팔로워가 많은 작성자(celebrity)의 TIL은 읽을 때 DB에서 가져와 합친다.
+    타임라인의 score 와 커서는 모두 TIL id 이다.
+    """
+
+    TIMELINE_KEY = "feed:{user_id}"
+    # 빈 타임라인과 캐시 미스를 구분하기 위한 표시 (score 0)
+    SENTINEL = "-"
+    FAN_OUT_BATCH_SIZE = 1000
+
+    @classmethod
+    def get_page(cls, user_id, cursor=None, size=None):
+        """
+        cursor(마지막으로 본 TIL id)보다 오래된 TIL을 최신순으로 size개 반환한다.
+        반환값: (TIL 목록, 다음 커서 또는 None)
+        """
+        size = size or settings.FEED_PAGE_SIZE
+        redis = get_redis()
+        key = cls.TIMELINE_KEY.format(user_id=user_id)
+        if not redis.exists(key):
+            cls.rebuild(user_id)
+
+        max_score = f"({cursor}" if cursor else "+inf"
+        ids = [
+            int(til_id)
+            for til_id in redis.zrevrangebyscore(
+                key, max_score, "(0", start=0, num=size + 1
+            )
+        ]
+        if len(ids) <= size and redis.zcard(key) > settings.FEED_MAX_LENGTH:
+            # 타임라인에 남아 있는 범위를 넘어가면 DB에서 이어서 가져온다.
+            before_id = ids[-1] if ids else cursor
+            ids += cls.query_ids(
+                user_id, before_id, size + 1 - len(ids), celebrities=False
+            )
+        ids += cls.query_ids(user_id, cursor, size + 1, celebrities=True)
+
+        ids = sorted(set(ids), reverse=True)[: size + 1]
+        page_ids = ids[:size]
+        tils = (
+            TIL.objects.filter(id__in=page_ids)
+            .select_related("user")
+            .only("id", "title", "excerpt", "created_at", "user__nickname")
+        )
+        tils_by_id = {til.id: til for til in tils}
+
+        # 삭제된 TIL은 타임라인에서도 지운다.
+        missing_ids = [til_id for til_id in page_ids if til_id not in tils_by_id]
+        if missing_ids:
+            redis.zrem(key, *missing_ids)
+
+        next_cursor = page_ids[-1] if len(ids) > size else None
+        feed = [tils_by_id[til_id] for til_id in page_ids if til_id in tils_by_id]
+        return feed, next_cursor
+
+    @staticmethod
+    def query_ids(user_id, before_id, limit, celebrities):
+        # 팔로우한 작성자 중 celebrity 여부로 나눠서 최신 TIL id를 조회
+        followed = Follow.objects.filter(follower_id=user_id)
+        if celebrities:
+            followed = followed.filter(
+                followed__followers_count__gte=settings.FEED_CELEBRITY_THRESHOLD
+            )
+        else:
+            followed = followed.filter(
+                followed__followers_count__lt=settings.FEED_CELEBRITY_THRESHOLD
+            )
+
+        queryset = TIL.objects.filter(user_id__in=followed.values("followed_id"))
+        if before_id:
+            queryset = queryset.filter(id__lt=before_id)
+        return list(queryset.order_by("-id").values_list("id", flat=True)[:limit])
+
+    @classmethod
+    def rebuild(cls, user_id):
+        # 일반 작성자들의 최신 TIL로 타임라인을 다시 만든다.
+        til_ids = cls.query_ids(
+            user_id, None, settings.FEED_MAX_LENGTH, celebrities=False
+        )
+        key = cls.TIMELINE_KEY.format(user_id=user_id)
+
+        pipeline = get_redis().pipeline()
+        pipeline.delete(key)
+        pipeline.zadd(key, {cls.SENTINEL: 0, **{til_id: til_id for til_id in til_ids}})
+        pipeline.expire(key, settings.FEED_TIMEOUT)
+        pipeline.execute()
+
+    @classmethod
+    def invalidate(cls, user_id):
+        get_redis().delete(cls.TIMELINE_KEY.format(user_id=user_id))
+
+    @classmethod
+    def fan_out(cls, til_id):
+        """
+        새 TIL을 작성자 팔로워들의 타임라인에 추가한다.
+        타임라인이 없는 팔로워는 다음 조회 때 DB에서 만들어지므로 건너뛴다.
+        """
+        til = TIL.objects.select_related("user").filter(id=til_id).first()
+        if til is None:
+            return
+        if til.user.followers_count >= settings.FEED_CELEBRITY_THRESHOLD:
+            return
+
+        follower_ids = (
+            Follow.objects.filter(followed_id=til.user_id)
+            .values_list("follower_id", flat=True)
+            .iterator(chunk_size=cls.FAN_OUT_BATCH_SIZE)
+        )
+        batch = []
+        for follower_id in follower_ids:
+            batch.append(cls.TIMELINE_KEY.format(user_id=follower_id))
+            if len(batch) >= cls.FAN_OUT_BATCH_SIZE:
+                cls._push(batch, til_id)
+                batch = []
+        if batch:
+            cls._push(batch, til_id)
+
+    @staticmethod
+    def _push(keys, til_id):
+        redis = get_redis()
+        pipeline = redis.pipeline(transaction=False)
+        for key in keys:
+            pipeline.exists(key)
+        existing_keys = [key for key, exists in zip(keys, pipeline.execute()) if exists]
+
+        pipeline = redis.pipeline(transaction=False)
+        for key in existing_keys:
+            pipeline.zadd(key, {til_id: til_id})
+            # sentinel(score 0)은 항상 가장 낮은 순위이므로 그 다음부터 오래된 항목을 잘라낸다.
+            pipeline.zremrangebyrank(key, 1, -(settings.FEED_MAX_LENGTH + 1))
+        pipeline.execute()
+
+    @classmethod
+    def schedule_fan_out(cls, til_id):
+        # TIL 작성 트랜잭션이 커밋된 뒤 팔로워 타임라인에 추가
+        from .tasks import fan_out_til_task
+
+        transaction.on_commit(lambda: fan_out_til_task.delay(til_id))
+
+
+class TILListService:
+    """
+    작성자별 TIL 목록의 버전. 목록에 보이는 TIL이 추가/수정/삭제되면 올려서
+    조건부 요청(ETag)이 작성자의 TIL 전체를 집계하지 않고 캐시 조회만으로 끝나게 한다.
+    """
+
+    VERSION_KEY = "til_list:{user_id}:version"
+
+    @classmethod
+    def get_version(cls, user_id):
+        return CacheVersion(cls.VERSION_KEY.format(user_id=user_id)).get()
+
+    @classmethod
+    def invalidate(cls, user_id):
+        CacheVersion(cls.VERSION_KEY.format(user_id=user_id)).bump_on_commit()
@@ -0,0 +1,29 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from follows.signals import followings_changed
+
+from .models import TIL
+from .services import FeedService, TILListService
+
+
+# 팔로잉 목록이 바뀌면 피드 타임라인을 지워 다음 조회 때 다시 만들도록 합니다.
+@receiver(followings_changed)
+def invalidate_feed(sender, follower_id, **kwargs):
+    transaction.on_commit(lambda: FeedService.invalidate(follower_id))
+
+
+# TIL 본문이 저장되면 커밋 이후 Markdown 렌더링 결과를 다시 만듭니다.
+@receiver(post_save, sender=TIL)
+def render_til_content(sender, instance, update_fields=None, **kwargs):
+    if update_fields is not None and "content" not in update_fields:
+        return
+    from .tasks import render_til_content_task
+
+    transaction.on_commit(lambda: render_til_content_task.delay(instance.id))
+
+
+# TIL이 추가/수정/삭제되면 작성자의 TIL 목록 버전을 올립니다.
+@receiver([post_save, post_delete], sender=TIL)
+def invalidate_til_list(sender, instance, **kwargs):
+    TILListService.invalidate(instance.user_id)
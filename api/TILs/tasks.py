@@ -0,0 +1,78 @@
+from datetime import timedelta
+
+from celery import shared_task
+from common.logger import logger
+from django.conf import settings
+from django.utils import timezone
+
+from .models import TIL, TILImage
+from .rendering import get_content_hash, render_markdown
+from .services import FeedService, TILListService
+from .utils import (
+    delete_orphaned_temp_images,
+    delete_s3_objects,
+    generate_til_image_variants,
+)
+
+
+@shared_task(bind=True, max_retries=5)
+def delete_s3_objects_task(self, keys):
+    failed = delete_s3_objects(keys)
+    if failed:
+        if self.request.retries >= self.max_retries:
+            logger.error(f"S3 객체 삭제 재시도 초과: {len(failed)}개 {failed[:10]}")
+            return failed
+        # 실패한 키만 점점 긴 간격으로 다시 시도
+        raise self.retry(args=[failed], countdown=60 * 2**self.request.retries)
+    return failed
+
+
+@shared_task
+def delete_orphaned_temp_images_task():
+    older_than = timezone.now() - timedelta(seconds=settings.TIL_TEMP_IMAGE_TTL)
+    return delete_orphaned_temp_images(older_than)
+
+
+@shared_task
+def generate_til_image_variants_task(image_ids):
+    for image in TILImage.objects.filter(id__in=image_ids, is_temporary=False):
+        try:
+            variants = generate_til_image_variants(image)
+        except Exception as e:
+            logger.error(f"TIL 이미지 variant 생성 실패: {image.id}, 에러: {str(e)}")
+            continue
+        # 작업 중에 이미지가 바뀌었으면 덮어쓰지 않는다.
+        TILImage.objects.filter(id=image.id, image=image.image).update(
+            variants=variants, updated_at=timezone.now()
+        )
+
+
+@shared_task
+def fan_out_til_task(til_id):
+    FeedService.fan_out(til_id)
+
+
+@shared_task
+def render_til_content_task(til_id):
+    til = (
+        TIL.objects.filter(id=til_id)
+        .only("id", "user", "content", "content_hash")
+        .first()
+    )
+    if til is None:
+        return
+    content_hash = get_content_hash(til.content)
+    if til.content_hash == content_hash:
+        return
+
+    rendered_html, excerpt = render_markdown(til.content)
+    # 렌더링하는 동안 본문이 바뀌었으면 덮어쓰지 않는다.
+    updated = TIL.objects.filter(id=til_id, content=til.content).update(
+        content_hash=content_hash,
+        rendered_html=rendered_html,
+        excerpt=excerpt,
+        updated_at=timezone.now(),
+    )
+    # update()는 시그널을 보내지 않으므로 목록에 보이는 요약이 바뀐 것을 직접 알린다.
+    if updated:
+        TILListService.invalidate(til.user_id)
@@ -4,18 +4,28 @@ from .views import (
     CreateTILView,
     DeleteTempImagesView,
     DeleteTILView,
+    PresignedTempImageUploadView,
     TILDetailView,
+    TILFeedView,
     TILListView,
+    TILSearchView,
     UpdateTILView,
     UploadTempImagesView,
 )
 
 urlpatterns = [
     path("upload/images/", UploadTempImagesView.as_view(), name="upload_temp_images"),
+    path(
+        "upload/images/presigned/",
+        PresignedTempImageUploadView.as_view(),
+        name="presigned_temp_images",
+    ),
     path("delete/images/", DeleteTempImagesView.as_view(), name="delete_temp_images"),
     path("create/", CreateTILView.as_view(), name="create-til"),
     path("update/<int:pk>/", UpdateTILView.as_view(), name="update-til"),
     path("delete/<int:pk>/", DeleteTILView.as_view(), name="delete-til"),
     path("list/<str:nickname>/", TILListView.as_view(), name="til-list"),
+    path("search/", TILSearchView.as_view(), name="til-search"),
+    path("feed/", TILFeedView.as_view(), name="til-feed"),
     path("<int:id>/", TILDetailView.as_view(), name="til-detail"),
 ]
@@ -0,0 +1,257 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import boto3
+from botocore.exceptions import ClientError
+from common.image_variants import build_image_variants
+from common.logger import logger
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import TILImage
+
+S3_DELETE_BATCH_SIZE = 1000  # delete_objects 한 번에 삭제 가능한 최대 키 개수
+# presigned 업로드에 허용하는 이미지 형식과 S3 키에 붙일 확장자
+PRESIGNED_IMAGE_EXTENSIONS = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/gif": "gif",
+    "image/webp": "webp",
+}
+
+
+@lru_cache(maxsize=None)
+def get_s3_client():
+    # boto3 클라이언트는 스레드 세이프하므로 요청마다 만들지 않고 프로세스 단위로 재사용
+    return boto3.client(
+        "s3",
+        endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+        region_name=settings.AWS_S3_REGION_NAME,
+    )
+
+
+def get_image_url(key):
+    return f"{settings.MEDIA_URL}{key}"
+
+
+def get_image_key(image_url):
+    return image_url.replace(settings.MEDIA_URL, "")
+
+
+def get_image_keys(image_url, variants):
+    # 원본과 variant 파일의 S3 키를 모두 반환
+    return [get_image_key(url) for url in [image_url, *variants.values()]]
+
+
+def make_temp_image_key(file_name):
+    return f"temp/{uuid.uuid4()}/{file_name}"
+
+
+def upload_temp_images(images):
+    """
+    이미지 파일들을 스레드 풀로 동시에 S3 임시 경로에 업로드하고 키 목록을 반환한다.
+    하나라도 실패하면 이미 올라간 파일을 지우고 예외를 다시 발생시킨다.
+    """
+    keys = [make_temp_image_key(image.name) for image in images]
+    s3_client = get_s3_client()
+
+    def upload(image, key):
+        s3_client.upload_fileobj(
+            image,
+            settings.AWS_STORAGE_BUCKET_NAME,
+            key,
+            ExtraArgs={"ContentType": image.content_type},
+        )
+        return key
+
+    max_workers = min(settings.TIL_IMAGE_UPLOAD_MAX_WORKERS, len(images))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(upload, image, key) for image, key in zip(images, keys)
+        ]
+
+    uploaded = [future.result() for future in futures if not future.exception()]
+    if len(uploaded) != len(keys):
+        if uploaded:
+            delete_s3_objects(uploaded)
+        raise next(future.exception() for future in futures if future.exception())
+    return keys
+
+
+def create_presigned_upload(content_type):
+    """
+    클라이언트가 S3에 직접 업로드할 수 있는 presigned POST 정보를 생성한다.
+    클라이언트가 보낸 파일 이름은 쓰지 않고 UUID와 content type 의 확장자로 키를 만든다.
+    """
+    extension = PRESIGNED_IMAGE_EXTENSIONS[content_type]
+    key = make_temp_image_key(f"{uuid.uuid4().hex}.{extension}")
+    presigned_post = get_s3_client().generate_presigned_post(
+        Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+        Key=key,
+        Fields={"Content-Type": content_type},
+        Conditions=[
+            {"Content-Type": content_type},
+            ["content-length-range", 1, settings.TIL_IMAGE_MAX_SIZE],
+        ],
+        ExpiresIn=settings.TIL_IMAGE_PRESIGNED_EXPIRES,
+    )
+    return key, presigned_post
+
+
+def copy_images_to_til(til, images):
+    """
+    임시 이미지들을 til/<id>/ 경로로 동시에 복사하고 이미지 정보를 갱신한다.
+    복사가 끝난 원본(임시) 키 목록을 반환하며, 원본 삭제는 호출하는 쪽에서 처리한다.
+    """
+    moves = []
+    for image in images:
+        original_key = get_image_key(image.image)
+        # 파일 이름에 UUID를 추가하여 고유성 보장
+        file_name = original_key.split("/")[-1]
+        new_key = f"til/{til.id}/{uuid.uuid4().hex[:8]}_{file_name}"
+        moves.append((image, original_key, new_key))
+
+    s3_client = get_s3_client()
+    bucket = settings.AWS_STORAGE_BUCKET_NAME
+
+    def copy(original_key, new_key):
+        # presigned 발급만 받고 실제로 업로드하지 않은 이미지는 연결하지 않는다.
+        try:
+            s3_client.head_object(Bucket=bucket, Key=original_key)
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                raise ValueError(f"업로드되지 않은 이미지입니다: {original_key}")
+            raise
+        s3_client.copy_object(
+            Bucket=bucket,
+            CopySource={"Bucket": bucket, "Key": original_key},
+            Key=new_key,
+        )
+        return new_key
+
+    max_workers = min(settings.TIL_IMAGE_UPLOAD_MAX_WORKERS, len(moves)) or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(copy, original_key, new_key)
+            for _, original_key, new_key in moves
+        ]
+
+    copied = [future.result() for future in futures if not future.exception()]
+    if len(copied) != len(moves):
+        # 일부만 복사된 경우 복사본을 지우고 실패로 처리
+        delete_s3_objects(copied)
+        raise next(future.exception() for future in futures if future.exception())
+
+    now = timezone.now()
+    for image, _, new_key in moves:
+        image.TIL = til
+        image.is_temporary = False
+        image.image = get_image_url(new_key)
+        image.updated_at = now
+    TILImage.objects.bulk_update(
+        [image for image, _, _ in moves], ["TIL", "is_temporary", "image", "updated_at"]
+    )
+    generate_til_image_variants_on_commit([image.id for image, _, _ in moves])
+    return [original_key for _, original_key, _ in moves]
+
+
+def generate_til_image_variants(image):
+    """
+    원본 이미지로 리사이즈된 variant들을 만들어 원본 옆에 업로드하고 URL을 반환한다.
+    """
+    s3_client = get_s3_client()
+    bucket = settings.AWS_STORAGE_BUCKET_NAME
+    source_key = get_image_key(image.image)
+    data = s3_client.get_object(Bucket=bucket, Key=source_key)["Body"].read()
+
+    variants = {}
+    for variant, key, content, content_type in build_image_variants(source_key, data):
+        s3_client.put_object(
+            Bucket=bucket, Key=key, Body=content, ContentType=content_type
+        )
+        variants[variant] = get_image_url(key)
+    return variants
+
+
+def generate_til_image_variants_on_commit(image_ids):
+    # 이미지가 TIL 경로로 옮겨진 트랜잭션이 커밋된 뒤 variant 생성 작업을 예약
+    if not image_ids:
+        return
+    from .tasks import generate_til_image_variants_task
+
+    image_ids = list(image_ids)
+    transaction.on_commit(lambda: generate_til_image_variants_task.delay(image_ids))
+
+
+def delete_s3_objects(keys):
+    """
+    S3 객체들을 delete_objects 로 최대 1,000개씩 묶어서 삭제하고 실패한 키 목록을 반환한다.
+    """
+    failed = []
+    s3_client = get_s3_client()
+    for start in range(0, len(keys), S3_DELETE_BATCH_SIZE):
+        batch = keys[start : start + S3_DELETE_BATCH_SIZE]
+        try:
+            response = s3_client.delete_objects(
+                Bucket=settings.AWS_STORAGE_BUCKET_NAME,
+                Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+            )
+        except Exception as e:
+            logger.error(f"S3 객체 삭제 실패: {len(batch)}개, 에러: {str(e)}")
+            failed.extend(batch)
+            continue
+        failed.extend(error["Key"] for error in response.get("Errors", []))
+    return failed
+
+
+def delete_s3_objects_on_commit(keys):
+    # 트랜잭션이 커밋된 뒤에만 S3 객체를 삭제하도록 Celery 작업을 예약
+    if not keys:
+        return
+    from .tasks import delete_s3_objects_task
+
+    keys = list(keys)
+    transaction.on_commit(lambda: delete_s3_objects_task.delay(keys))
+
+
+def delete_orphaned_temp_images(older_than):
+    """
+    older_than 이전에 업로드된 뒤 TIL에 연결되지 않은 임시 이미지를
+    최대 1,000개씩 끊어서 S3와 DB에서 함께 삭제하고, 삭제한 개수를 반환한다.
+    """
+    deleted = 0
+    queryset = TILImage.objects.filter(
+        is_temporary=True, TIL__isnull=True, created_at__lt=older_than
+    )
+    last = None
+    while True:
+        # 부분 인덱스(created_at) 순서대로 (created_at, id) 키셋으로 끊어서 조회
+        page = queryset
+        if last is not None:
+            page = page.filter(created_at__gte=last[0]).exclude(
+                created_at=last[0], id__lte=last[1]
+            )
+        batch = list(
+            page.order_by("created_at", "id").values_list("created_at", "id", "image")[
+                :S3_DELETE_BATCH_SIZE
+            ]
+        )
+        if not batch:
+            break
+        last = batch[-1][:2]
+
+        keys = {get_image_key(url): image_id for _, image_id, url in batch}
+        failed_keys = set(delete_s3_objects(list(keys)))
+        deleted_ids = [
+            image_id for key, image_id in keys.items() if key not in failed_keys
+        ]
+        TILImage.objects.filter(
+            id__in=deleted_ids, TIL__isnull=True, is_temporary=True
+        ).delete()
+        deleted += len(deleted_ids)
+
+        if len(batch) < S3_DELETE_BATCH_SIZE:
+            break
+    return deleted
@@ -1,9 +1,7 @@
-import uuid
-
-import boto3
-from django.conf import settings
+from common.conditional import conditional_get, make_etag
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import Count, F, Max, Q
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import (
     OpenApiExample,
@@ -13,13 +11,35 @@ from drf_spectacular.utils import (
     extend_schema,
 )
 from rest_framework import generics, serializers, status
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, CursorPagination
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 from users.models import User
 
 from .models import TIL, TILImage
-from .serializers import TILDetailSerializer, TILListSerializer
+from .rendering import HEADLINE_START_SEL, HEADLINE_STOP_SEL
+from .serializers import (
+    PresignedImageUploadSerializer,
+    TILDetailSerializer,
+    TILFeedResponseSerializer,
+    TILFeedSerializer,
+    TILListSerializer,
+    TILSearchQuerySerializer,
+    TILSearchSerializer,
+)
+from .services import FeedService, TILListService
+from .utils import (
+    copy_images_to_til,
+    create_presigned_upload,
+    delete_s3_objects,
+    delete_s3_objects_on_commit,
+    get_image_key,
+    get_image_keys,
+    get_image_url,
+    upload_temp_images,
+)
 
 
 @extend_schema(
@@ -66,29 +86,83 @@ class UploadTempImagesView(generics.CreateAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        s3_client = boto3.client("s3")
-        uploaded_images = []
+        try:
+            # 여러 이미지를 스레드 풀로 동시에 업로드
+            keys = upload_temp_images(images)
+        except Exception as e:
+            return Response(
+                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
 
-        for image in images:
-            file_name = f"temp/{uuid.uuid4()}/{image.name}"
+        temp_images = TILImage.objects.bulk_create(
+            [TILImage(TIL=None, image=get_image_url(key)) for key in keys]
+        )
+        uploaded_images = [
+            {"image_id": temp_image.id, "image_url": temp_image.image}
+            for temp_image in temp_images
+        ]
+        return Response(uploaded_images, status=status.HTTP_201_CREATED)
 
-            try:
-                s3_client.upload_fileobj(
-                    image, settings.AWS_STORAGE_BUCKET_NAME, file_name
-                )
-                image_url = f"{settings.MEDIA_URL}{file_name}"
 
-                temp_image = TILImage.objects.create(TIL=None, image=image_url)
-                uploaded_images.append(
-                    {"image_id": temp_image.id, "image_url": image_url}
-                )
+@extend_schema(
+    tags=["TIL"],
+    summary="임시 이미지 직접 업로드 URL 발급",
+    description=(
+        "클라이언트가 S3에 이미지를 직접 업로드할 수 있도록 presigned POST 정보를 발급합니다. "
+        "응답의 upload.url 로 upload.fields 와 file 을 multipart/form-data 로 전송하면 되며, "
+        "서버는 임시 이미지 정보만 기록합니다. 발급받은 image_id 는 TIL 작성/수정 시 그대로 사용합니다."
+    ),
+    request=PresignedImageUploadSerializer,
+    responses={
+        201: OpenApiExample(
+            "성공 응답",
+            value=[
+                {
+                    "image_id": 1,
+                    "image_url": "https://example.com/media/temp/uuid/3f2b9c1d.jpg",
+                    "upload": {
+                        "url": "https://bucket.s3.amazonaws.com/",
+                        "fields": {"key": "temp/uuid/3f2b9c1d.jpg", "policy": "..."},
+                    },
+                }
+            ],
+        ),
+        400: OpenApiResponse(description="잘못된 요청"),
+        500: OpenApiResponse(description="서버 오류"),
+    },
+)
+class PresignedTempImageUploadView(generics.GenericAPIView):
+    serializer_class = PresignedImageUploadSerializer
+    permission_classes = [IsAuthenticated]
 
-            except Exception as e:
-                return Response(
-                    {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
-                )
+    def post(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
 
-        return Response(uploaded_images, status=status.HTTP_201_CREATED)
+        try:
+            uploads = [
+                create_presigned_upload(file["content_type"])
+                for file in serializer.validated_data["files"]
+            ]
+        except Exception as e:
+            return Response(
+                {"error": str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+        temp_images = TILImage.objects.bulk_create(
+            [TILImage(TIL=None, image=get_image_url(key)) for key, _ in uploads]
+        )
+        return Response(
+            [
+                {
+                    "image_id": temp_image.id,
+                    "image_url": temp_image.image,
+                    "upload": presigned_post,
+                }
+                for temp_image, (_, presigned_post) in zip(temp_images, uploads)
+            ],
+            status=status.HTTP_201_CREATED,
+        )
 
 
 @extend_schema(
@@ -142,22 +216,21 @@ class DeleteTempImagesView(generics.GenericAPIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        queryset = self.get_queryset().filter(
-            Q(id__in=image_ids) & Q(TIL__isnull=True) & Q(is_temporary=True)
+        images = dict(
+            self.get_queryset()
+            .filter(Q(id__in=image_ids) & Q(TIL__isnull=True) & Q(is_temporary=True))
+            .values_list("id", "image")
         )
-        s3_client = boto3.client("s3")
-
-        deleted_ids = []
-        for image in queryset:
-            try:
-                key = image.image.split("/", 3)[-1]
-                s3_client.delete_object(
-                    Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key
-                )
-                deleted_ids.append(image.id)
-                image.delete()
-            except Exception as e:
-                print(f"Error deleting image {image.id}: {str(e)}")
+        # S3 객체를 한 번에 삭제한 뒤 성공한 이미지만 DB에서 일괄 삭제
+        failed_keys = set(
+            delete_s3_objects([get_image_key(url) for url in images.values()])
+        )
+        deleted_ids = [
+            image_id
+            for image_id, url in images.items()
+            if get_image_key(url) not in failed_keys
+        ]
+        TILImage.objects.filter(id__in=deleted_ids).delete()
 
         if len(deleted_ids) != len(image_ids):
             not_deleted = set(image_ids) - set(deleted_ids)
@@ -223,44 +296,28 @@ class CreateTILView(generics.CreateAPIView):
             # 오류 발생 시 트랜잭션 롤백 및 예외 발생
             transaction.set_rollback(True)
             raise serializers.ValidationError(f"이미지 처리 중 오류 발생: {str(e)}")
+        # 커밋 이후 팔로워들의 피드에 추가
+        FeedService.schedule_fan_out(TIL.id)
 
     def process_images(self, TIL, image_ids):
+        if not image_ids:
+            return
+        # 요청된 임시 이미지를 한 번의 쿼리로 조회
+        images = list(
+            TILImage.objects.filter(
+                id__in=image_ids, TIL__isnull=True, is_temporary=True
+            )
+        )
+        found_ids = {image.id for image in images}
         for image_id in image_ids:
-            try:
-                image = TILImage.objects.get(id=image_id, is_temporary=True)
-                image.TIL = TIL
-                image.is_temporary = False
-                # 원본 이미지의 키 추출
-                original_key = image.image.replace(settings.MEDIA_URL, "")
-                # 파일 이름에 UUID를 추가하여 고유성 보장
-                file_name = original_key.split("/")[-1]
-                unique_id = uuid.uuid4().hex[:8]  # 8자리 고유 ID 생성
-                new_file_name = f"{unique_id}_{file_name}"
-
-                # 새 경로 생성
-                new_key = f"til/{TIL.id}/{new_file_name}"
-
-                s3_client = boto3.client("s3")
-                s3_client.copy_object(
-                    Bucket=settings.AWS_STORAGE_BUCKET_NAME,
-                    CopySource={
-                        "Bucket": settings.AWS_STORAGE_BUCKET_NAME,
-                        "Key": original_key,
-                    },
-                    Key=new_key,
-                )
-                s3_client.delete_object(
-                    Bucket=settings.AWS_STORAGE_BUCKET_NAME,
-                    Key=original_key,
-                )
-                image.image = f"https://{settings.MEDIA_URL}/{new_key}"
-                image.save()
-            except TILImage.DoesNotExist:
+            if image_id not in found_ids:
                 raise serializers.ValidationError(
                     f"이미지 ID {image_id}를 찾을 수 없습니다."
                 )
-            except Exception as e:
-                raise serializers.ValidationError(f"이미지 처리 중 오류 발생: {str(e)}")
+
+        # S3 복사는 동시에 처리하고, 임시 파일 삭제는 커밋 이후 한꺼번에 처리
+        original_keys = copy_images_to_til(TIL, images)
+        delete_s3_objects_on_commit(original_keys)
 
 
 @extend_schema(
@@ -321,56 +378,27 @@ class UpdateTILView(generics.UpdateAPIView):
             raise serializers.ValidationError(f"TIL 업데이트 중 오류 발생: {str(e)}")
 
     def process_images(self, TIL, image_ids):
+        # 요청된 이미지를 한 번의 쿼리로 조회
+        images = list(TILImage.objects.filter(id__in=image_ids))
+        if any(image.TIL_id not in (None, TIL.id) for image in images):
+            # 다른 TIL에서 가져온 이미지
+            raise serializers.ValidationError("이미지는 다른 TIL에 속해 있습니다.")
+
         # 기존 이미지 중 새로운 image_ids에 없는 것들을 삭제
         images_to_delete = TIL.images.exclude(id__in=image_ids)
-        for image in images_to_delete:
-            self.delete_image_from_s3(image.image)
+        deleted_keys = [
+            key
+            for image_url, variants in images_to_delete.values_list("image", "variants")
+            for key in get_image_keys(image_url, variants)
+        ]
         images_to_delete.delete()
 
-        for image_id in image_ids:
-            try:
-                image = TILImage.objects.get(id=image_id)
-                if image.TIL is None:
-                    # 새로 추가된 이미지
-                    image.TIL = TIL
-                    image.is_temporary = False
-                    # 파일 이름에 UUID를 추가하여 고유성 보장
-                    unique_id = uuid.uuid4().hex[:8]  # 8자리 고유 ID 생성
-                    new_file_name = f"{unique_id}_{image.image.split("/")[-1]}"
-
-                    # 새 경로 생성
-                    new_path = f"til/{TIL.id}/{new_file_name}"
-                    self.move_image_in_s3(image.image, new_path)
-                    image.image = f"https://{settings.MEDIA_URL}/{new_path}"
-                    image.save()
-                elif image.TIL != TIL:
-                    # 다른 TIL에서 가져온 이미지
-                    return Response(
-                        {"error": "이미지는 다른 TIL에 속해 있습니다."},
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
-            except TILImage.DoesNotExist:
-                pass
-
-    def delete_image_from_s3(self, image_url):
-        s3_client = boto3.client("s3")
-        key = image_url.replace(settings.MEDIA_URL, "")
-        s3_client.delete_object(Bucket=settings.AWS_STORAGE_BUCKET_NAME, Key=key)
-
-    def move_image_in_s3(self, old_path, new_path):
-        s3_client = boto3.client("s3")
-        s3_client.copy_object(
-            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
-            CopySource={
-                "Bucket": settings.AWS_STORAGE_BUCKET_NAME,
-                "Key": old_path.replace(settings.MEDIA_URL, ""),
-            },
-            Key=new_path,
-        )
-        s3_client.delete_object(
-            Bucket=settings.AWS_STORAGE_BUCKET_NAME,
-            Key=old_path.replace(settings.MEDIA_URL, ""),
-        )
+        # 새로 추가된 이미지는 TIL 경로로 동시에 복사
+        new_images = [image for image in images if image.TIL_id is None]
+        original_keys = copy_images_to_til(TIL, new_images) if new_images else []
+
+        # S3 파일 삭제는 커밋 이후 한꺼번에 처리
+        delete_s3_objects_on_commit(deleted_keys + original_keys)
 
 
 @extend_schema(
@@ -395,26 +423,101 @@ class DeleteTILView(generics.DestroyAPIView):
                 status=status.HTTP_403_FORBIDDEN,
             )
 
-        s3_client = boto3.client("s3")
-        for image in instance.images.all():
-            s3_client.delete_object(
-                Bucket=settings.AWS_STORAGE_BUCKET_NAME,
-                Key=image.image.replace(settings.MEDIA_URL, ""),
-            )
+        # DB 삭제를 먼저 커밋하고, S3 파일은 커밋 이후 백그라운드에서 일괄 삭제
+        with transaction.atomic():
+            keys = [
+                key
+                for image_url, variants in instance.images.values_list(
+                    "image", "variants"
+                )
+                for key in get_image_keys(image_url, variants)
+            ]
+            self.perform_destroy(instance)
+            delete_s3_objects_on_commit(keys)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+# 검색 결과는 순위로 정렬하므로 페이지 번호를 쓰되, 전체 개수(COUNT)는 세지 않고
+# 한 건을 더 조회해서 다음 페이지가 있는지만 확인한다.
+class TILSearchPagination(BasePagination):
+    page_size = 10
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        try:
+            self.page = int(request.query_params.get("page", 1))
+        except ValueError:
+            raise NotFound("Invalid page.")
+        if self.page < 1:
+            raise NotFound("Invalid page.")
+
+        offset = (self.page - 1) * self.page_size
+        results = list(queryset[offset : offset + self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        return results[: self.page_size]
+
+    def get_page_link(self, page):
+        url = self.request.build_absolute_uri()
+        if page == 1:
+            return remove_query_param(url, "page")
+        return replace_query_param(url, "page", page)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_page_link(self.page + 1) if self.has_next else None,
+                "previous": (
+                    self.get_page_link(self.page - 1) if self.page > 1 else None
+                ),
+                "results": data,
+            }
+        )
 
-        return super().destroy(request, *args, **kwargs)
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": "page",
+                "required": False,
+                "in": "query",
+                "description": "페이지 번호",
+                "schema": {"type": "integer"},
+            }
+        ]
 
 
-class TILPagination(PageNumberPagination):
+# 작성 시간 기준 커서 페이지네이션 (COUNT 쿼리 없이 인덱스 범위 스캔)
+class TILCursorPagination(CursorPagination):
     page_size = 10
-    page_size_query_param = None
-    max_page_size = 10
+    ordering = ("-created_at", "-id")
+
+
+def til_list_etag(request, nickname):
+    # 작성자의 TIL 목록 버전과 요청한 페이지(커서)로 ETag 계산 (작성자가 없으면 None)
+    user_id = (
+        User.objects.filter(nickname=nickname).values_list("id", flat=True).first()
+    )
+    if user_id is None:
+        return None
+    return make_etag(
+        user_id, TILListService.get_version(user_id), request.get_full_path()
+    )
 
 
 @extend_schema(
     tags=["TIL"],
     summary="TIL 리스트 조회",
-    description="특정 사용자의 TIL 리스트를 조회합니다.",
+    description="특정 사용자의 TIL 리스트를 최신순으로 조회합니다. 응답의 next 링크로 다음 페이지를 조회합니다.",
     parameters=[
         OpenApiParameter(
             name="nickname",
@@ -426,15 +529,34 @@ class TILPagination(PageNumberPagination):
     ],
     responses={200: TILListSerializer(many=True)},
 )
+@conditional_get(etag_func=til_list_etag)
 class TILListView(generics.ListAPIView):
     serializer_class = TILListSerializer
     permission_classes = [AllowAny]
-    pagination_class = TILPagination
+    pagination_class = TILCursorPagination
 
     def get_queryset(self):
         nickname = self.kwargs["nickname"]
-        user = get_object_or_404(User, nickname=nickname)
-        return TIL.objects.filter(user=user).order_by("-created_at")
+        user = get_object_or_404(User.objects.only("id"), nickname=nickname)
+        # 목록에 필요한 컬럼만 조회 (content 등 큰 컬럼 제외)
+        return TIL.objects.filter(user=user).only(
+            "id", "title", "excerpt", "created_at"
+        )
+
+
+def til_detail_etag(request, id):
+    # TIL 본문과 이미지들의 수정 시간만 조회해서 ETag 계산 (TIL이 없으면 None)
+    summary = (
+        TIL.objects.filter(id=id)
+        .annotate(image_count=Count("images"), images_updated=Max("images__updated_at"))
+        .values("updated_at", "image_count", "images_updated")
+        .first()
+    )
+    if summary is None:
+        return None
+    return make_etag(
+        summary["updated_at"], summary["image_count"], summary["images_updated"] or ""
+    )
 
 
 @extend_schema(
@@ -452,8 +574,129 @@ class TILListView(generics.ListAPIView):
     ],
     responses={200: TILDetailSerializer},
 )
+@conditional_get(etag_func=til_detail_etag)
 class TILDetailView(generics.RetrieveAPIView):
-    queryset = TIL.objects.all()
+    queryset = TIL.objects.defer("search_vector").prefetch_related("images")
     serializer_class = TILDetailSerializer
     permission_classes = [AllowAny]
     lookup_field = "id"
+
+
+@extend_schema(
+    tags=["TIL"],
+    summary="TIL 검색",
+    description="TIL 제목과 내용에서 검색어를 찾아 관련도 순으로 반환합니다. 작성자 닉네임과 작성 날짜 범위로 결과를 좁힐 수 있습니다.",
+    parameters=[
+        OpenApiParameter(
+            name="q",
+            description="검색어 (따옴표, OR, - 연산자 사용 가능)",
+            required=True,
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="nickname",
+            description="작성자 닉네임",
+            required=False,
+            type=OpenApiTypes.STR,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="start_date",
+            description="작성 날짜 시작 (YYYY-MM-DD)",
+            required=False,
+            type=OpenApiTypes.DATE,
+            location=OpenApiParameter.QUERY,
+        ),
+        OpenApiParameter(
+            name="end_date",
+            description="작성 날짜 끝 (YYYY-MM-DD)",
+            required=False,
+            type=OpenApiTypes.DATE,
+            location=OpenApiParameter.QUERY,
+        ),
+    ],
+    responses={
+        200: TILSearchSerializer(many=True),
+        400: OpenApiResponse(description="잘못된 검색 조건"),
+    },
+)
+class TILSearchView(generics.ListAPIView):
+    serializer_class = TILSearchSerializer
+    permission_classes = [AllowAny]
+    pagination_class = TILSearchPagination
+
+    def get_queryset(self):
+        params = TILSearchQuerySerializer(data=self.request.query_params)
+        params.is_valid(raise_exception=True)
+        filters = params.validated_data
+
+        # 한국어 형태소 분석기가 없으므로 'simple' 설정으로 단어 단위 검색
+        query = SearchQuery(filters["q"], config="simple", search_type="websearch")
+        queryset = TIL.objects.filter(search_vector=query)
+        if "nickname" in filters:
+            queryset = queryset.filter(user__nickname=filters["nickname"])
+        if "start_date" in filters:
+            queryset = queryset.filter(created_at__date__gte=filters["start_date"])
+        if "end_date" in filters:
+            queryset = queryset.filter(created_at__date__lte=filters["end_date"])
+
+        return (
+            queryset.select_related("user")
+            .only("id", "title", "created_at", "user__nickname")
+            .annotate(
+                rank=SearchRank(F("search_vector"), query),
+                headline=SearchHeadline(
+                    "content",
+                    query,
+                    config="simple",
+                    # 본문은 이스케이프되지 않은 Markdown 이므로 구분자로 표시해 두고
+                    # 직렬화할 때 이스케이프한 뒤 <mark> 로 바꾼다.
+                    start_sel=HEADLINE_START_SEL,
+                    stop_sel=HEADLINE_STOP_SEL,
+                    max_words=35,
+                    min_words=15,
+                    max_fragments=2,
+                ),
+            )
+            .order_by("-rank", "-id")
+        )
+
+
+@extend_schema(
+    tags=["TIL"],
+    summary="TIL 피드 조회",
+    description="내가 팔로우한 사용자들의 TIL을 최신순으로 조회합니다. 응답의 next_cursor 값을 cursor 로 넘기면 다음 페이지를 조회합니다.",
+    parameters=[
+        OpenApiParameter(
+            name="cursor",
+            description="이전 응답의 next_cursor 값",
+            required=False,
+            type=OpenApiTypes.INT,
+            location=OpenApiParameter.QUERY,
+        ),
+    ],
+    responses={
+        200: TILFeedResponseSerializer,
+        400: OpenApiResponse(description="잘못된 커서"),
+    },
+)
+class TILFeedView(generics.GenericAPIView):
+    serializer_class = TILFeedSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, *args, **kwargs):
+        cursor = request.query_params.get("cursor")
+        if cursor is not None and not cursor.isdigit():
+            return Response(
+                {"error": "잘못된 커서입니다."}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        tils, next_cursor = FeedService.get_page(
+            request.user.id, cursor=int(cursor) if cursor else None
+        )
+        serializer = self.get_serializer(tils, many=True)
+        return Response(
+            {"results": serializer.data, "next_cursor": next_cursor},
+            status=status.HTTP_200_OK,
+        )
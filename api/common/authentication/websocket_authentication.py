@@ -0,0 +1,58 @@
+from urllib.parse import parse_qs
+
+from channels.middleware import BaseMiddleware
+from channels.sessions import CookieMiddleware
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.tokens import AccessToken
+
+
+class JWTAuthMiddleware(BaseMiddleware):
+    """
+    웹소켓 연결의 gamja_access 쿠키(또는 ?token=)로 사용자를 인증해 scope["user"]에 넣는다.
+    재연결이 몰려도 DB 조회가 반복되지 않도록 사용자 정보를 짧게 캐시한다.
+    """
+
+    USER_KEY = "ws_user:{user_id}"
+
+    async def __call__(self, scope, receive, send):
+        scope = dict(scope, user=await self.get_user(self.get_raw_token(scope)))
+        return await super().__call__(scope, receive, send)
+
+    @staticmethod
+    def get_raw_token(scope):
+        raw_token = scope.get("cookies", {}).get("gamja_access")
+        if raw_token is None:
+            query = parse_qs(scope.get("query_string", b"").decode())
+            raw_token = query.get("token", [None])[0]
+        return raw_token
+
+    @classmethod
+    async def get_user(cls, raw_token):
+        if not raw_token:
+            return AnonymousUser()
+        try:
+            user_id = AccessToken(raw_token)[settings.SIMPLE_JWT["USER_ID_CLAIM"]]
+        except (TokenError, KeyError):
+            return AnonymousUser()
+
+        key = cls.USER_KEY.format(user_id=user_id)
+        user = await cache.aget(key)
+        if user is None:
+            user = (
+                await get_user_model()
+                .objects.filter(id=user_id, is_active=True)
+                .only("id", "username", "nickname", "is_active")
+                .afirst()
+            )
+            if user is None:
+                return AnonymousUser()
+            await cache.aset(key, user, timeout=settings.WEBSOCKET_USER_CACHE_TIMEOUT)
+        return user
+
+
+def JWTAuthMiddlewareStack(inner):
+    return CookieMiddleware(JWTAuthMiddleware(inner))
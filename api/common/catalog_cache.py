@@ -0,0 +1,74 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from .conditional import make_etag
+
+
+class CacheVersion:
+    """
+    캐시 항목이나 ETag 에 붙이는 버전 번호. 데이터가 바뀌면 bump()로 올린다.
+    """
+
+    def __init__(self, key):
+        self.key = key
+
+    def get(self):
+        version = cache.get(self.key)
+        if version is None:
+            # 버전 키가 사라졌을 때 예전 버전 번호를 다시 쓰지 않도록 현재 시각으로 시작
+            cache.add(self.key, int(time.time() * 1000), timeout=None)
+            version = cache.get(self.key)
+        return version
+
+    def bump(self):
+        try:
+            cache.incr(self.key)
+        except ValueError:
+            cache.add(self.key, int(time.time() * 1000), timeout=None)
+
+    def bump_on_commit(self):
+        # 커밋 전에 올리면 이전 데이터가 새 버전으로 캐시될 수 있으므로 커밋 이후에 올린다.
+        transaction.on_commit(self.bump)
+
+
+class CatalogCache:
+    """
+    모든 사용자가 같은 내용을 보는 카탈로그(아이템 상점, 기술 스택 등)의 직렬화 결과 캐시.
+    데이터가 바뀌면 bump()로 버전만 올리고, 이전 버전 캐시는 만료될 때까지 두었다가 사라진다.
+    """
+
+    VERSION_KEY = "catalog:{name}:version"
+    ENTRY_KEY = "catalog:{name}:{version}"
+
+    def __init__(self, name):
+        self.name = name
+        self.version = CacheVersion(self.VERSION_KEY.format(name=name))
+
+    def get_version(self):
+        return self.version.get()
+
+    def bump(self):
+        self.version.bump()
+
+    def get(self, build):
+        """
+        현재 버전의 캐시 항목을 반환한다. 없으면 build()로 데이터를 만들어 저장한다.
+        항목: {"data": 직렬화 데이터, "content": JSON bytes, "etag": ETag}
+        """
+        version = self.get_version()
+        entry_key = self.ENTRY_KEY.format(name=self.name, version=version)
+        entry = cache.get(entry_key)
+        if entry is None:
+            data = build()
+            content = JSONRenderer().render(data)
+            entry = {
+                "data": data,
+                "content": content,
+                "etag": make_etag(self.name, version),
+            }
+            cache.set(entry_key, entry, timeout=settings.CATALOG_CACHE_TIMEOUT)
+        return entry
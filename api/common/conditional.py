@@ -0,0 +1,24 @@
+import hashlib
+
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+
+
+def make_etag(*parts):
+    # 응답 내용을 결정하는 값들로 ETag 생성 (None 이 있으면 리소스가 없는 것으로 본다)
+    if any(part is None for part in parts):
+        return None
+    return hashlib.md5("|".join(str(part) for part in parts).encode()).hexdigest()
+
+
+def conditional_get(etag_func=None, last_modified_func=None):
+    """
+    뷰 클래스의 get 메서드에 ETag / Last-Modified 조건부 응답을 적용하는 데코레이터.
+    etag_func, last_modified_func 는 (request, *args, **kwargs) 를 받아 가벼운 쿼리로
+    값을 계산하며, 클라이언트가 가진 값과 같으면 뷰를 실행하지 않고 304를 반환한다.
+    인증과 권한 검사는 DRF dispatch 단계에서 먼저 처리된다.
+    """
+    return method_decorator(
+        condition(etag_func=etag_func, last_modified_func=last_modified_func),
+        name="get",
+    )
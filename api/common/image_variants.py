@@ -0,0 +1,59 @@
+from hashlib import sha256
+from io import BytesIO
+
+from PIL import Image, ImageOps
+
+# variant 이름: (긴 변의 최대 길이, 저장 포맷). 포맷이 None이면 원본 투명도에 따라 JPEG/PNG
+IMAGE_VARIANTS = {
+    "thumbnail": (320, None),
+    "medium": (1280, None),
+    "webp": (1280, "WEBP"),
+}
+
+FORMAT_OPTIONS = {
+    "JPEG": {"quality": 85, "optimize": True, "progressive": True},
+    "PNG": {"optimize": True},
+    "WEBP": {"quality": 80},
+}
+
+FORMAT_EXTENSIONS = {"JPEG": "jpg", "PNG": "png", "WEBP": "webp"}
+
+
+def make_variant_key(source_key, variant, content, extension):
+    """
+    원본과 같은 경로에 내용 해시를 포함한 키를 만든다.
+    같은 결과물은 항상 같은 키가 되므로 작업이 재시도되어도 파일이 늘어나지 않는다.
+    """
+    directory, _, file_name = source_key.rpartition("/")
+    stem = file_name.rsplit(".", 1)[0]
+    digest = sha256(content).hexdigest()[:16]
+    name = f"{stem}_{variant}_{digest}.{extension}"
+    return f"{directory}/{name}" if directory else name
+
+
+def build_image_variants(source_key, data):
+    """
+    원본 이미지 바이트로 썸네일/중간 크기/WebP variant를 만들어
+    (variant 이름, 키, 바이트, content type) 목록을 반환한다.
+    """
+    with Image.open(BytesIO(data)) as source:
+        # 휴대폰 사진의 EXIF 회전 정보를 실제 픽셀에 반영
+        image = ImageOps.exif_transpose(source)
+        has_alpha = "A" in image.getbands() or "transparency" in image.info
+
+        variants = []
+        for variant, (max_size, image_format) in IMAGE_VARIANTS.items():
+            image_format = image_format or ("PNG" if has_alpha else "JPEG")
+            mode = "RGBA" if has_alpha and image_format != "JPEG" else "RGB"
+
+            resized = image.convert(mode)
+            resized.thumbnail((max_size, max_size), Image.LANCZOS)
+
+            buffer = BytesIO()
+            resized.save(buffer, format=image_format, **FORMAT_OPTIONS[image_format])
+            content = buffer.getvalue()
+
+            extension = FORMAT_EXTENSIONS[image_format]
+            key = make_variant_key(source_key, variant, content, extension)
+            variants.append((variant, key, content, f"image/{image_format.lower()}"))
+    return variants
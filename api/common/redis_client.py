@@ -0,0 +1,10 @@
+from functools import lru_cache
+
+import redis
+from django.conf import settings
+
+
+@lru_cache(maxsize=None)
+def get_redis():
+    # 커넥션 풀을 프로세스 단위로 재사용
+    return redis.Redis.from_url(settings.REDIS_URL, decode_responses=True)
@@ -9,18 +9,30 @@ https://docs.djangoproject.com/en/5.1/howto/deployment/asgi/
 
 import os
 
-from channels.auth import AuthMiddlewareStack
-from channels.routing import ProtocolTypeRouter, URLRouter
 from django.core.asgi import get_asgi_application
-from django.urls import path
-from notifications.consumers import NotificationConsumer
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+# 앱 레지스트리를 먼저 초기화한 뒤 모델을 사용하는 모듈을 import 해야 한다.
+django_asgi_app = get_asgi_application()
+
+from channels.routing import ProtocolTypeRouter, URLRouter  # noqa: E402
+from channels.security.websocket import OriginValidator  # noqa: E402
+from common.authentication.websocket_authentication import (  # noqa: E402
+    JWTAuthMiddlewareStack,
+)
+from django.conf import settings  # noqa: E402
+from django.urls import path  # noqa: E402
+from notifications.consumers import NotificationConsumer  # noqa: E402
+
 application = ProtocolTypeRouter(
     {
-        "http": get_asgi_application(),
-        "websocket": AuthMiddlewareStack(
-            URLRouter([path("ws/notifications/", NotificationConsumer.as_asgi())])
+        "http": django_asgi_app,
+        # 쿠키로 인증하므로 다른 사이트에서 연결을 열지 못하도록 허용한 Origin 만 받는다.
+        "websocket": OriginValidator(
+            JWTAuthMiddlewareStack(
+                URLRouter([path("ws/notifications/", NotificationConsumer.as_asgi())])
+            ),
+            [origin for origin in settings.CORS_ALLOWED_ORIGINS if origin],
         ),
     }
 )
@@ -73,6 +73,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "channels",
     "common.apps.CommonConfig",
     "TILs.apps.TilsConfig",
@@ -252,6 +253,17 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 REDIS_PASSWORD = os.environ.get("REDIS_PASSWORD", "")
 CELERY_BROKER_URL = f"redis://:{REDIS_PASSWORD}@redis:6379/0"
 CELERY_RESULT_BACKEND = f"redis://:{REDIS_PASSWORD}@redis:6379/0"
+# 피드 타임라인 등 Redis 자료구조를 직접 다루는 데이터 저장소
+REDIS_URL = f"redis://:{REDIS_PASSWORD}@redis:6379/2"
+
+# 캐시 설정 (추천 목록 등 미리 계산된 데이터 저장)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": f"redis://:{REDIS_PASSWORD}@redis:6379/1",
+        "KEY_PREFIX": "gamja",
+    }
+}
 
 CELERY_BEAT_SCHEDULE = {
     "update-github-commits-every-30-minutes": {
@@ -302,8 +314,74 @@ CELERY_BEAT_SCHEDULE = {
         "task": "programmers.tasks.update_all_users_programmers_info",
         "schedule": crontab(hour=0, minute=0),
     },
+    "apply-follow-count-deltas-every-minute": {
+        "task": "follows.tasks.apply_follow_count_deltas_task",
+        "schedule": 60,  # 1분마다 팔로워/팔로잉 수 변경분 반영
+    },
+    "delete-orphaned-til-temp-images-every-hour": {
+        "task": "TILs.tasks.delete_orphaned_temp_images_task",
+        "schedule": crontab(minute=30),
+    },
+    "dispatch-notification-outbox-every-minute": {
+        "task": "notifications.tasks.dispatch_notification_outbox_task",
+        "schedule": 60,  # 실패 후 재시도 대기 중인 알림 전송
+    },
+    "send-notification-digests-every-10-minutes": {
+        "task": "notifications.tasks.send_notification_digests_task",
+        "schedule": crontab(minute="*/10"),
+    },
+    "update-follow-suggestions-at-04-00": {
+        "task": "follows.tasks.update_all_users_follow_suggestions",
+        "schedule": crontab(hour=4, minute=0),
+    },
 }
 
+# 팔로우 추천 설정
+FOLLOW_SUGGESTION_SIZE = 20  # 사용자별로 캐시에 저장할 추천 후보 수
+FOLLOW_SUGGESTION_MUTUAL_WEIGHT = 3  # 함께 아는 팔로잉 1명당 점수
+FOLLOW_SUGGESTION_STACK_WEIGHT = 1  # 겹치는 기술 스택 1개당 점수
+FOLLOW_SUGGESTION_TIMEOUT = 60 * 60 * 24 * 2  # 추천 캐시 유지 시간 (초)
+
+# 아이템 상점, 기술 스택 등 공용 카탈로그 캐시 유지 시간 (초)
+CATALOG_CACHE_TIMEOUT = 60 * 60 * 24
+# 사용자별 감자 합성 이미지 URL 캐시 유지 시간 (초)
+POTATO_RENDER_CACHE_TIMEOUT = 60 * 60 * 24
+
+# 프로필 카드 설정
+PROFILE_CARD_MAX_USERS = 50  # 한 번에 조회할 수 있는 최대 사용자 수
+PROFILE_CARD_CACHE_TIMEOUT = 60  # 카드별 캐시 유지 시간 (초)
+
+# TIL 피드 설정
+FEED_PAGE_SIZE = 20  # 피드 한 페이지에 보여줄 TIL 수
+FEED_MAX_LENGTH = 500  # 사용자별 Redis 타임라인에 보관할 최대 TIL 수
+FEED_TIMEOUT = 60 * 60 * 24 * 7  # 타임라인 유지 시간 (초), 지나면 DB에서 다시 만든다.
+FEED_CELEBRITY_THRESHOLD = 10000  # 이 팔로워 수 이상인 작성자는 읽을 때 합친다.
+
+# 읽지 않은 알림 수 카운터 유지 시간 (초), 만료되면 DB에서 다시 센다.
+NOTIFICATION_UNREAD_COUNT_TIMEOUT = 60 * 60
+
+# 알림 outbox 전송 설정
+NOTIFICATION_OUTBOX_BATCH_SIZE = 100  # 한 번에 전송할 알림 수
+NOTIFICATION_OUTBOX_MAX_ATTEMPTS = 5  # 이 횟수만큼 실패하면 전송을 포기한다.
+NOTIFICATION_OUTBOX_RETRY_DELAY = (
+    5  # 재시도 기본 대기 시간 (초), 실패할수록 두 배씩 늘어난다.
+)
+
+# 같은 종류의 알림을 하나로 합치는 시간 (초)
+NOTIFICATION_COALESCE_WINDOW = 60
+# 바로 보내지 않고 주기적인 요약 알림으로 모아 보낼 알림 종류
+NOTIFICATION_DIGEST_TYPES = []
+# 웹소켓 재연결 시 한 번에 다시 보내는 최대 알림 수
+NOTIFICATION_REPLAY_LIMIT = 100
+
+# 웹소켓 연결 시 JWT 로 조회한 사용자 정보 캐시 유지 시간 (초)
+WEBSOCKET_USER_CACHE_TIMEOUT = 60
+
+# 웹소켓 접속 상태 유지 시간 (초), 이 시간 동안 갱신되지 않은 연결은 끊긴 것으로 본다.
+PRESENCE_TIMEOUT = 90
+# 연결이 유지되는 동안 서버가 접속 상태를 갱신하는 주기 (초)
+PRESENCE_REFRESH_INTERVAL = 30
+
 # 웹소켓 처리 layers
 CHANNEL_LAYERS = {
     "default": {
@@ -322,6 +400,16 @@ AWS_SECRET_ACCESS_KEY = os.environ.get("AWS_SECRET_ACCESS_KEY")
 AWS_STORAGE_BUCKET_NAME = os.environ.get("AWS_STORAGE_BUCKET_NAME")
 AWS_S3_REGION_NAME = os.environ.get("AWS_S3_REGION_NAME")
 AWS_QUERYSTRING_AUTH = False
+# MinIO, LocalStack 등 로컬 S3 호환 서버를 사용할 때만 설정
+AWS_S3_ENDPOINT_URL = os.environ.get("AWS_S3_ENDPOINT_URL")
+
+# TIL 이미지 업로드 설정
+TIL_IMAGE_UPLOAD_MAX_WORKERS = 5  # 서버 경유 업로드 시 동시 업로드 스레드 수
+TIL_IMAGE_PRESIGNED_EXPIRES = 60 * 10  # presigned POST 유효 시간 (초)
+TIL_IMAGE_MAX_SIZE = (
+    10 * 1024 * 1024
+)  # presigned POST 로 업로드 가능한 최대 크기 (bytes)
+TIL_TEMP_IMAGE_TTL = 60 * 60 * 24  # TIL에 연결되지 않은 임시 이미지 보관 시간 (초)
 
 DEFAULT_FILE_STORAGE = "storages.backends.s3boto3.S3Boto3Storage"
 STATICFILES_STORAGE = "storages.backends.s3boto3.S3Boto3Storage"
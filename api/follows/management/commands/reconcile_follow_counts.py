@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from follows.utils import reconcile_follow_counts
+
+
+class Command(BaseCommand):
+    help = "Follow 테이블을 기준으로 모든 사용자의 팔로워/팔로잉 수를 다시 계산합니다."
+
+    def handle(self, *args, **options):
+        updated = reconcile_follow_counts()
+        self.stdout.write(
+            self.style.SUCCESS(f"{updated}명의 팔로워/팔로잉 수를 재계산했습니다.")
+        )
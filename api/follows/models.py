@@ -1,8 +1,9 @@
 from common.models import TimeStampModel
 from django.db import models
-from django.db.models import F
 from users.models import User
 
+from .signals import followings_changed
+
 
 class Follow(TimeStampModel):
     follower = models.ForeignKey(
@@ -19,14 +20,37 @@ class Follow(TimeStampModel):
         created = not self.pk
         super().save(*args, **kwargs)
         if created:
-            self.followed.followers_count = F("followers_count") + 1
-            self.followed.save()
-            self.follower.following_count = F("following_count") + 1
-            self.follower.save()
+            FollowCountDelta.record(self.follower_id, [self.followed_id], 1)
+            followings_changed.send(sender=Follow, follower_id=self.follower_id)
 
     def delete(self, *args, **kwargs):
-        self.followed.followers_count = F("followers_count") - 1
-        self.followed.save()
-        self.follower.following_count = F("following_count") - 1
-        self.follower.save()
-        super().delete(*args, **kwargs)
+        FollowCountDelta.record(self.follower_id, [self.followed_id], -1)
+        result = super().delete(*args, **kwargs)
+        followings_changed.send(sender=Follow, follower_id=self.follower_id)
+        return result
+
+
+class FollowCountDelta(models.Model):
+    """
+    팔로워/팔로잉 수의 변경분.
+    팔로우할 때마다 User 행을 직접 갱신하면 인기 사용자 행에 잠금이 몰리므로,
+    변경분은 이 테이블에 insert 만 하고 주기적으로 User 에 합산한다.
+    """
+
+    user = models.ForeignKey(
+        User, related_name="follow_count_deltas", on_delete=models.CASCADE
+    )
+    followers_delta = models.IntegerField(default=0)
+    following_delta = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    @classmethod
+    def record(cls, follower_id, followed_ids, sign):
+        # follower 는 팔로잉 수가, followed 는 각각 팔로워 수가 sign 만큼 변한다.
+        deltas = [
+            cls(user_id=followed_id, followers_delta=sign)
+            for followed_id in followed_ids
+        ]
+        if deltas:
+            deltas.append(cls(user_id=follower_id, following_delta=sign * len(deltas)))
+            cls.objects.bulk_create(deltas)
@@ -22,3 +22,39 @@ class FollowListSerializer(serializers.Serializer):
     users = UserSerializer(many=True)
     total_followers = serializers.IntegerField()
     total_following = serializers.IntegerField()
+
+
+class FollowSuggestionSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    nickname = serializers.CharField()
+    profile_url = serializers.CharField(allow_null=True)
+    user_tier = serializers.CharField()
+    mutual_count = serializers.IntegerField()
+    shared_stack_count = serializers.IntegerField()
+
+
+class BulkFollowSerializer(serializers.Serializer):
+    MAX_TARGETS = 100
+
+    nicknames = serializers.ListField(
+        child=serializers.CharField(), required=False, default=list
+    )
+    user_ids = serializers.ListField(
+        child=serializers.IntegerField(), required=False, default=list
+    )
+
+    def validate(self, data):
+        total = len(data["nicknames"]) + len(data["user_ids"])
+        if total == 0:
+            raise serializers.ValidationError("nicknames 또는 user_ids를 입력해주세요.")
+        if total > self.MAX_TARGETS:
+            raise serializers.ValidationError(
+                f"한 번에 최대 {self.MAX_TARGETS}명까지 처리할 수 있습니다."
+            )
+        return data
+
+
+class BulkFollowResultSerializer(serializers.Serializer):
+    processed = serializers.ListField(child=serializers.CharField())
+    skipped = serializers.ListField(child=serializers.CharField())
+    not_found = serializers.ListField(child=serializers.CharField())
@@ -0,0 +1,107 @@
+from collections import Counter
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+from stacks.models import UserStack
+from users.models import User
+
+from .models import Follow
+
+
+class FollowSuggestionService:
+    """
+    친구의 친구(함께 아는 팔로잉)와 겹치는 기술 스택을 기준으로
+    "알 수도 있는 사람" 후보를 미리 계산해 캐시에 저장한다.
+    """
+
+    CACHE_KEY = "follow_suggestions:{user_id}"
+    PENDING_KEY = "follow_suggestions:pending:{user_id}"
+    REFRESH_DELAY = 30  # 팔로우 변경이 몰릴 때 재계산을 묶어서 처리하기 위한 지연 (초)
+
+    @classmethod
+    def get_suggestions(cls, user_id):
+        # 캐시에 저장된 추천 목록을 그대로 반환 (없으면 None)
+        return cache.get(cls.CACHE_KEY.format(user_id=user_id))
+
+    @classmethod
+    def refresh(cls, user_id):
+        cache.delete(cls.PENDING_KEY.format(user_id=user_id))
+        suggestions = cls.compute(user_id)
+        cache.set(
+            cls.CACHE_KEY.format(user_id=user_id),
+            suggestions,
+            timeout=settings.FOLLOW_SUGGESTION_TIMEOUT,
+        )
+        return suggestions
+
+    @classmethod
+    def schedule_refresh(cls, user_id):
+        # 이미 예약된 재계산이 있으면 중복 예약하지 않는다.
+        if not cache.add(
+            cls.PENDING_KEY.format(user_id=user_id), 1, timeout=cls.REFRESH_DELAY * 2
+        ):
+            return
+        from .tasks import update_follow_suggestions
+
+        update_follow_suggestions.apply_async(
+            args=[user_id], countdown=cls.REFRESH_DELAY
+        )
+
+    @staticmethod
+    def compute(user_id):
+        size = settings.FOLLOW_SUGGESTION_SIZE
+        following = Follow.objects.filter(follower_id=user_id).values("followed_id")
+
+        # 내가 팔로우하는 사람들이 팔로우하는 사용자 (2-hop)
+        mutual_counts = (
+            Follow.objects.filter(follower_id__in=following)
+            .exclude(followed_id__in=following)
+            .exclude(followed_id=user_id)
+            .values("followed_id")
+            .annotate(mutual_count=Count("follower_id"))
+            .order_by("-mutual_count")[: size * 5]
+        )
+        # 나와 같은 기술 스택을 선택한 사용자
+        shared_stack_counts = (
+            UserStack.objects.filter(
+                stack_id__in=UserStack.objects.filter(user_id=user_id).values(
+                    "stack_id"
+                )
+            )
+            .exclude(user_id__in=following)
+            .exclude(user_id=user_id)
+            .values("user_id")
+            .annotate(shared_stack_count=Count("stack_id", distinct=True))
+            .order_by("-shared_stack_count")[: size * 5]
+        )
+
+        mutual = {row["followed_id"]: row["mutual_count"] for row in mutual_counts}
+        shared = {
+            row["user_id"]: row["shared_stack_count"] for row in shared_stack_counts
+        }
+
+        scores = Counter()
+        for candidate_id, count in mutual.items():
+            scores[candidate_id] += count * settings.FOLLOW_SUGGESTION_MUTUAL_WEIGHT
+        for candidate_id, count in shared.items():
+            scores[candidate_id] += count * settings.FOLLOW_SUGGESTION_STACK_WEIGHT
+
+        ranked_ids = [candidate_id for candidate_id, _ in scores.most_common(size)]
+        users = User.objects.filter(id__in=ranked_ids, is_active=True).only(
+            "id", "nickname", "profile_url", "user_tier"
+        )
+        users_by_id = {user.id: user for user in users}
+
+        return [
+            {
+                "id": candidate_id,
+                "nickname": users_by_id[candidate_id].nickname,
+                "profile_url": users_by_id[candidate_id].profile_url,
+                "user_tier": users_by_id[candidate_id].user_tier,
+                "mutual_count": mutual.get(candidate_id, 0),
+                "shared_stack_count": shared.get(candidate_id, 0),
+            }
+            for candidate_id in ranked_ids
+            if candidate_id in users_by_id
+        ]
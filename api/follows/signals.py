@@ -0,0 +1,15 @@
+from django.db import transaction
+from django.dispatch import Signal, receiver
+
+# 사용자의 팔로잉 목록이 바뀌었을 때 보내는 시그널 (인자: follower_id)
+# 단건 팔로우/언팔로우와 일괄 처리 모두 follower 당 한 번씩 보낸다.
+followings_changed = Signal()
+
+
+# 팔로잉 목록이 바뀌면 해당 사용자의 추천 목록을 커밋 이후에 다시 계산합니다.
+@receiver(followings_changed)
+def refresh_follow_suggestions(sender, follower_id, **kwargs):
+    # 지연 임포트를 사용하여 순환 참조 방지
+    from .services import FollowSuggestionService
+
+    transaction.on_commit(lambda: FollowSuggestionService.schedule_refresh(follower_id))
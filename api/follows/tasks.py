@@ -0,0 +1,24 @@
+from celery import shared_task
+from django.contrib.auth import get_user_model
+
+from .services import FollowSuggestionService
+from .utils import apply_follow_count_deltas
+
+User = get_user_model()
+
+
+@shared_task
+def update_follow_suggestions(user_id):
+    FollowSuggestionService.refresh(user_id)
+
+
+@shared_task
+def update_all_users_follow_suggestions():
+    user_ids = User.objects.filter(is_active=True).values_list("id", flat=True)
+    for user_id in user_ids.iterator():
+        FollowSuggestionService.refresh(user_id)
+
+
+@shared_task
+def apply_follow_count_deltas_task():
+    return apply_follow_count_deltas()
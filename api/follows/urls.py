@@ -4,6 +4,8 @@ from . import views
 
 urlpatterns = [
     path("search/", views.UserSearchView.as_view(), name="user-search"),
+    path("follow-bulk/", views.BulkFollowView.as_view(), name="bulk-follow"),
+    path("unfollow-bulk/", views.BulkUnfollowView.as_view(), name="bulk-unfollow"),
     path("follow/<str:nickname>/", views.FollowView.as_view(), name="follow"),
     path("unfollow/<str:nickname>/", views.UnfollowView.as_view(), name="unfollow"),
     path(
@@ -21,6 +23,11 @@ urlpatterns = [
         views.UserFollowingListView.as_view(),
         name="user-following-list",
     ),
+    path(
+        "suggestions/",
+        views.FollowSuggestionListView.as_view(),
+        name="follow-suggestions",
+    ),
     path("followers/", views.OwnFollowersListView.as_view(), name="own-followers-list"),
     path("following/", views.OwnFollowingListView.as_view(), name="own-following-list"),
 ]
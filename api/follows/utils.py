@@ -0,0 +1,97 @@
+from collections import defaultdict
+
+from django.db import connection, transaction
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Greatest, Now
+from users.models import User
+
+from .models import Follow, FollowCountDelta
+
+
+def apply_follow_count_deltas(batch_size=5000):
+    """
+    쌓인 팔로워/팔로잉 변경분을 사용자별로 합산해 User 에 반영하고 삭제한다.
+    반영한 변경분 개수를 반환한다.
+    """
+    applied = 0
+    while True:
+        with transaction.atomic():
+            rows = list(
+                FollowCountDelta.objects.select_for_update(skip_locked=True)
+                .order_by("id")
+                .values_list("id", "user_id", "followers_delta", "following_delta")[
+                    :batch_size
+                ]
+            )
+            if not rows:
+                break
+
+            totals = defaultdict(lambda: [0, 0])
+            for _, user_id, followers_delta, following_delta in rows:
+                totals[user_id][0] += followers_delta
+                totals[user_id][1] += following_delta
+
+            for user_id, (followers_delta, following_delta) in totals.items():
+                if not followers_delta and not following_delta:
+                    continue
+                User.objects.filter(id=user_id).update(
+                    followers_count=Greatest(
+                        F("followers_count") + followers_delta, Value(0)
+                    ),
+                    following_count=Greatest(
+                        F("following_count") + following_delta, Value(0)
+                    ),
+                    updated_at=Now(),
+                )
+
+            FollowCountDelta.objects.filter(id__in=[row[0] for row in rows]).delete()
+            applied += len(rows)
+
+        if len(rows) < batch_size:
+            break
+    return applied
+
+
+@transaction.atomic
+def reconcile_follow_counts():
+    """
+    Follow 테이블을 기준으로 모든 사용자의 팔로워/팔로잉 수를 다시 계산한다.
+    재계산하는 동안 팔로우 변경이 끼어들지 않도록 Follow 테이블에 쓰기 잠금을 건다.
+    반영된 사용자 수를 반환한다.
+    """
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'LOCK TABLE "{Follow._meta.db_table}" IN SHARE ROW EXCLUSIVE MODE'
+            )
+
+    followers = (
+        Follow.objects.filter(followed=OuterRef("pk"))
+        .values("followed")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    following = (
+        Follow.objects.filter(follower=OuterRef("pk"))
+        .values("follower")
+        .annotate(count=Count("id"))
+        .values("count")
+    )
+    # 실제 수와 다른 사용자만 갱신
+    updated = (
+        User.objects.alias(
+            actual_followers=Coalesce(Subquery(followers), 0),
+            actual_following=Coalesce(Subquery(following), 0),
+        )
+        .exclude(
+            followers_count=F("actual_followers"),
+            following_count=F("actual_following"),
+        )
+        .update(
+            followers_count=F("actual_followers"),
+            following_count=F("actual_following"),
+            updated_at=Now(),
+        )
+    )
+    FollowCountDelta.objects.all().delete()
+    return updated
@@ -1,3 +1,5 @@
+from django.db import transaction
+from django.db.models import Q
 from django.shortcuts import get_object_or_404
 from drf_spectacular.utils import (
     OpenApiParameter,
@@ -5,14 +7,23 @@ from drf_spectacular.utils import (
     OpenApiTypes,
     extend_schema,
 )
+from notifications.services import NotificationService
 from rest_framework import generics, status
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from users.models import User
 
-from .models import Follow
-from .serializers import FollowListSerializer, UserSerializer
+from .models import Follow, FollowCountDelta
+from .serializers import (
+    BulkFollowResultSerializer,
+    BulkFollowSerializer,
+    FollowListSerializer,
+    FollowSuggestionSerializer,
+    UserSerializer,
+)
+from .services import FollowSuggestionService
+from .signals import followings_changed
 
 
 @extend_schema(
@@ -193,6 +204,132 @@ class RemoveFollowerView(generics.DestroyAPIView):
             )
 
 
+class BulkFollowMixin:
+    serializer_class = BulkFollowSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_target_users(self, data):
+        # 닉네임과 ID를 한 번의 쿼리로 조회 (자기 자신은 처리 대상에서 제외)
+        users = list(
+            User.objects.filter(
+                Q(nickname__in=data["nicknames"]) | Q(id__in=data["user_ids"])
+            ).only("id", "nickname")
+        )
+        found_nicknames = {user.nickname for user in users}
+        found_ids = {user.id for user in users}
+        not_found = [
+            nickname
+            for nickname in data["nicknames"]
+            if nickname not in found_nicknames
+        ] + [str(user_id) for user_id in data["user_ids"] if user_id not in found_ids]
+        users = [user for user in users if user.id != self.request.user.id]
+        return users, not_found
+
+    def bulk_response(self, processed, skipped, not_found):
+        return Response(
+            {
+                "processed": [user.nickname for user in processed],
+                "skipped": [user.nickname for user in skipped],
+                "not_found": not_found,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+@extend_schema(
+    tags=["follow"],
+    summary="여러 사용자 일괄 팔로우",
+    description=(
+        "닉네임 또는 ID 목록으로 여러 사용자를 한 번에 팔로우합니다. (최대 100명) "
+        "이미 팔로우 중인 사용자는 skipped, 존재하지 않는 사용자는 not_found로 반환됩니다."
+    ),
+    request=BulkFollowSerializer,
+    responses={
+        200: BulkFollowResultSerializer,
+        400: OpenApiResponse(description="잘못된 요청"),
+    },
+)
+class BulkFollowView(BulkFollowMixin, generics.GenericAPIView):
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        users, not_found = self.get_target_users(serializer.validated_data)
+
+        with transaction.atomic():
+            followed = self.create_follows(request.user, users)
+            # 실제로 추가된 팔로우만 카운터와 알림에 반영 (알림은 커밋 이후 한 번에 생성)
+            FollowCountDelta.record(request.user.id, [user.id for user in followed], 1)
+            NotificationService.notify_followed(
+                request.user.id, [user.id for user in followed]
+            )
+            if followed:
+                followings_changed.send(sender=Follow, follower_id=request.user.id)
+
+        skipped = [user for user in users if user not in followed]
+        return self.bulk_response(followed, skipped, not_found)
+
+    @staticmethod
+    def create_follows(follower, users):
+        """
+        팔로우를 한 번에 추가하고 실제로 추가된 사용자 목록을 반환한다.
+        이미 팔로우 중인 사용자는 ignore_conflicts 로 건너뛰고, 이번에 추가된 행은
+        저장할 때 채워진 created_at 이 DB 값과 같은지 한 번의 쿼리로 확인한다.
+        (bulk_create 는 post_save 시그널을 보내지 않는다.)
+        """
+        follows = Follow.objects.bulk_create(
+            [Follow(follower=follower, followed=user) for user in users],
+            ignore_conflicts=True,
+        )
+        created_at = {follow.followed_id: follow.created_at for follow in follows}
+        inserted_ids = {
+            followed_id
+            for followed_id, created in Follow.objects.filter(
+                follower=follower, followed_id__in=created_at
+            ).values_list("followed_id", "created_at")
+            if created == created_at[followed_id]
+        }
+        return [user for user in users if user.id in inserted_ids]
+
+
+@extend_schema(
+    tags=["follow"],
+    summary="여러 사용자 일괄 언팔로우",
+    description=(
+        "닉네임 또는 ID 목록으로 여러 사용자를 한 번에 언팔로우합니다. (최대 100명) "
+        "팔로우하고 있지 않은 사용자는 skipped, 존재하지 않는 사용자는 not_found로 반환됩니다."
+    ),
+    request=BulkFollowSerializer,
+    responses={
+        200: BulkFollowResultSerializer,
+        400: OpenApiResponse(description="잘못된 요청"),
+    },
+)
+class BulkUnfollowView(BulkFollowMixin, generics.GenericAPIView):
+
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        users, not_found = self.get_target_users(serializer.validated_data)
+
+        with transaction.atomic():
+            following_ids = set(
+                Follow.objects.filter(
+                    follower=request.user, followed__in=users
+                ).values_list("followed_id", flat=True)
+            )
+            Follow.objects.filter(
+                follower=request.user, followed_id__in=following_ids
+            ).delete()
+            FollowCountDelta.record(request.user.id, list(following_ids), -1)
+            if following_ids:
+                followings_changed.send(sender=Follow, follower_id=request.user.id)
+
+        unfollowed = [user for user in users if user.id in following_ids]
+        skipped = [user for user in users if user.id not in following_ids]
+        return self.bulk_response(unfollowed, skipped, not_found)
+
+
 class FollowPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = None
@@ -297,3 +434,24 @@ class UserFollowingListView(FollowListMixin, generics.ListAPIView):
         user = get_object_or_404(User, nickname=nickname)
         queryset = self.get_queryset(user, relationship="followers__follower")
         return Response(self.get_response_data(user, queryset))
+
+
+@extend_schema(
+    tags=["follow"],
+    summary="팔로우 추천 목록 조회",
+    description=(
+        "함께 아는 팔로잉과 겹치는 기술 스택을 기준으로 미리 계산된 추천 사용자 목록을 조회합니다. "
+        "아직 계산된 목록이 없으면 빈 목록을 반환하고 백그라운드에서 계산을 시작합니다."
+    ),
+    responses={200: FollowSuggestionSerializer(many=True)},
+)
+class FollowSuggestionListView(generics.GenericAPIView):
+    serializer_class = FollowSuggestionSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        suggestions = FollowSuggestionService.get_suggestions(request.user.id)
+        if suggestions is None:
+            FollowSuggestionService.schedule_refresh(request.user.id)
+            suggestions = []
+        return Response(suggestions, status=status.HTTP_200_OK)
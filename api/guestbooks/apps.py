@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class GuestbooksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'guestbooks'
+
+    def ready(self):
+        import guestbooks.signals
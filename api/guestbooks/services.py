@@ -0,0 +1,31 @@
+from common.catalog_cache import CacheVersion
+
+from .models import Guestbook
+
+
+class GuestbookListService:
+    """
+    방명록 주인별 방명록 목록의 버전. 방명록이 추가/수정/삭제되거나 작성자 닉네임이 바뀌면 올려서
+    조건부 요청(ETag)이 방명록 전체를 집계하지 않고 캐시 조회만으로 끝나게 한다.
+    """
+
+    VERSION_KEY = "guestbook_list:{host_id}:version"
+
+    @classmethod
+    def get_version(cls, host_id):
+        return CacheVersion(cls.VERSION_KEY.format(host_id=host_id)).get()
+
+    @classmethod
+    def invalidate(cls, host_id):
+        CacheVersion(cls.VERSION_KEY.format(host_id=host_id)).bump_on_commit()
+
+    @classmethod
+    def invalidate_for_guest(cls, guest_id):
+        # 작성자 닉네임은 목록에 함께 보이므로 작성자가 글을 남긴 방명록을 모두 갱신
+        host_ids = (
+            Guestbook.objects.filter(guest_id=guest_id)
+            .values_list("host_id", flat=True)
+            .distinct()
+        )
+        for host_id in host_ids:
+            cls.invalidate(host_id)
@@ -0,0 +1,22 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from users.models import User
+
+from .models import Guestbook
+from .services import GuestbookListService
+
+
+# 방명록이 추가/수정/삭제되면 방명록 주인의 목록 버전을 올립니다.
+@receiver([post_save, post_delete], sender=Guestbook)
+def invalidate_guestbook_list(sender, instance, **kwargs):
+    GuestbookListService.invalidate(instance.host_id)
+
+
+# 닉네임이 바뀔 수 있는 저장이면 그 사용자가 작성한 방명록 목록 버전을 올립니다.
+@receiver(post_save, sender=User)
+def invalidate_guestbook_list_for_guest(
+    sender, instance, created, update_fields=None, **kwargs
+):
+    if created or (update_fields is not None and "nickname" not in update_fields):
+        return
+    GuestbookListService.invalidate_for_guest(instance.id)
@@ -1,3 +1,4 @@
+from common.conditional import conditional_get, make_etag
 from django.shortcuts import get_object_or_404
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
@@ -9,6 +10,7 @@ from users.models import User
 
 from .models import Guestbook
 from .serializers import GuestbookSerializer
+from .services import GuestbookListService
 
 
 @extend_schema(
@@ -109,6 +111,18 @@ class GuestbookPagination(PageNumberPagination):
     max_page_size = 10
 
 
+def guestbook_list_etag(request, nickname):
+    # 방명록 목록 버전과 요청한 페이지로 ETag 계산 (방명록 주인이 없으면 None)
+    host_id = (
+        User.objects.filter(nickname=nickname).values_list("id", flat=True).first()
+    )
+    if host_id is None:
+        return None
+    return make_etag(
+        host_id, GuestbookListService.get_version(host_id), request.get_full_path()
+    )
+
+
 @extend_schema(
     tags=["guestbook"],
     summary="방명록 리스트 조회",
@@ -124,6 +138,7 @@ class GuestbookPagination(PageNumberPagination):
     ],
     responses={200: GuestbookSerializer(many=True)},
 )
+@conditional_get(etag_func=guestbook_list_etag)
 class ListGuestbookView(generics.ListAPIView):
     serializer_class = GuestbookSerializer
     permission_classes = [AllowAny]
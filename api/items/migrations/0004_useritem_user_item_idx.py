@@ -0,0 +1,19 @@
+# Generated by Django 5.1 on 2026-10-19 18:11
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0003_item_image_variants'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='useritem',
+            index=models.Index(fields=['user', 'item'], name='useritem_user_item_idx'),
+        ),
+    ]
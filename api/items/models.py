@@ -14,6 +14,8 @@ class Item(TimeStampModel):
     price = models.PositiveIntegerField(null=False)
     item_type = models.CharField(max_length=50, null=False)
     image = models.ImageField(upload_to=item_image_upload_to, null=True, blank=True)
+    # 리사이즈된 이미지의 스토리지 경로 ({"thumbnail": name, "medium": name, "webp": name})
+    image_variants = models.JSONField(default=dict, blank=True)
 
     def __str__(self):
         return self.name
@@ -29,5 +31,10 @@ class UserItem(TimeStampModel):
     purchase_date = models.DateTimeField(auto_now_add=True)
     is_selected = models.BooleanField(default=False)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "item"], name="useritem_user_item_idx"),
+        ]
+
     def __str__(self):
         return f"{self.user} owns {self.item}"
@@ -1,3 +1,4 @@
+from django.db import transaction
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
@@ -8,6 +9,7 @@ from .models import Item, UserItem
 # 아이템 목록
 class ItemSerializer(serializers.ModelSerializer):
     image_url = serializers.SerializerMethodField()
+    image_variants = serializers.SerializerMethodField()
     is_purchased = serializers.SerializerMethodField()
 
     class Meta:
@@ -19,6 +21,7 @@ class ItemSerializer(serializers.ModelSerializer):
             "price",
             "item_type",
             "image_url",
+            "image_variants",
             "is_purchased",
         ]
 
@@ -33,8 +36,25 @@ class ItemSerializer(serializers.ModelSerializer):
 
         return None
 
+    # 썸네일/중간 크기/WebP 이미지 URL 반환. 아직 생성되지 않았으면 빈 객체 반환.
+    @extend_schema_field({"type": "object", "additionalProperties": {"type": "string"}})
+    def get_image_variants(self, obj):
+        if not obj.image:
+            return {}
+        request = self.context.get("request")
+        variants = {}
+        for variant, name in obj.image_variants.items():
+            url = obj.image.storage.url(name)
+            variants[variant] = request.build_absolute_uri(url) if request else url
+        return variants
+
     @extend_schema_field(OpenApiTypes.BOOL)
     def get_is_purchased(self, obj):
+        # 뷰에서 보유 아이템 ID를 한 번에 조회해 넘겨준 경우 추가 쿼리 없이 확인
+        owned_item_ids = self.context.get("owned_item_ids")
+        if owned_item_ids is not None:
+            return obj.id in owned_item_ids
+
         # 요청 사용자를 가져옴
         request = self.context.get("request")
         if not request or not request.user.is_authenticated:
@@ -71,6 +91,28 @@ class ItemImageUploadSerializer(serializers.ModelSerializer):
         fields = ["id", "image"]
 
     def update(self, instance, validated_data):
-        instance.image = validated_data.get("image", instance.image)
+        # tasks -> services -> serializers 순환 import 를 피하기 위해 함수 안에서 import
+        from .tasks import (
+            delete_item_image_files_task,
+            generate_item_image_variants_task,
+        )
+
+        stale_names = []
+        if "image" in validated_data:
+            instance.image = validated_data["image"]
+            # 이전 이미지의 variant는 더 이상 사용하지 않음
+            stale_names = list(instance.image_variants.values())
+            instance.image_variants = {}
         instance.save()
+        if instance.image:
+            # 이전 variant 파일은 새 variant가 저장된 뒤 작업에서 삭제
+            transaction.on_commit(
+                lambda: generate_item_image_variants_task.delay(
+                    instance.id, stale_names
+                )
+            )
+        elif stale_names:
+            transaction.on_commit(
+                lambda: delete_item_image_files_task.delay(stale_names)
+            )
         return instance
@@ -0,0 +1,60 @@
+from common.catalog_cache import CatalogCache
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Item, UserItem
+from .serializers import ItemSerializer
+
+
+class ItemCatalogService:
+    """
+    아이템 상점 목록은 모든 사용자가 공유하는 캐시에서 꺼내고,
+    사용자별 구매 여부(is_purchased)는 캐시된 보유 아이템 ID로 합쳐서 반환한다.
+    """
+
+    catalog = CatalogCache("items")
+    OWNED_KEY = "item_owned:{user_id}"
+
+    @classmethod
+    def get_catalog(cls):
+        # 공용 캐시에는 요청(host/scheme)에 의존하지 않는 저장소 URL만 담는다.
+        def build():
+            serializer = ItemSerializer(
+                Item.objects.order_by("id"),
+                many=True,
+                context={"owned_item_ids": set()},
+            )
+            return serializer.data
+
+        return cls.catalog.get(build)
+
+    @staticmethod
+    def build_item_data(request, item, owned_item_ids):
+        # 캐시된 아이템에 요청 기준 절대 URL과 사용자별 구매 여부를 합친다.
+        image_url = item["image_url"]
+        return {
+            **item,
+            "image_url": request.build_absolute_uri(image_url) if image_url else None,
+            "image_variants": {
+                variant: request.build_absolute_uri(url)
+                for variant, url in item["image_variants"].items()
+            },
+            "is_purchased": item["id"] in owned_item_ids,
+        }
+
+    @classmethod
+    def get_owned_item_ids(cls, user_id):
+        key = cls.OWNED_KEY.format(user_id=user_id)
+        owned_item_ids = cache.get(key)
+        if owned_item_ids is None:
+            owned_item_ids = set(
+                UserItem.objects.filter(user_id=user_id).values_list(
+                    "item_id", flat=True
+                )
+            )
+            cache.set(key, owned_item_ids, timeout=settings.CATALOG_CACHE_TIMEOUT)
+        return owned_item_ids
+
+    @classmethod
+    def invalidate_owned_item_ids(cls, user_id):
+        cache.delete(cls.OWNED_KEY.format(user_id=user_id))
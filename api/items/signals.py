@@ -0,0 +1,20 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Item, UserItem
+from .services import ItemCatalogService
+
+
+# 아이템이 추가/수정/삭제되면 상점 목록 캐시 버전을 올립니다.
+@receiver([post_save, post_delete], sender=Item)
+def bump_item_catalog(sender, **kwargs):
+    transaction.on_commit(ItemCatalogService.catalog.bump)
+
+
+# 구매 내역이 바뀌면 해당 사용자의 보유 아이템 캐시를 지웁니다.
+@receiver([post_save, post_delete], sender=UserItem)
+def invalidate_owned_item_ids(sender, instance, **kwargs):
+    transaction.on_commit(
+        lambda: ItemCatalogService.invalidate_owned_item_ids(instance.user_id)
+    )
@@ -0,0 +1,52 @@
+from celery import shared_task
+from common.image_variants import build_image_variants
+from common.logger import logger
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.utils import timezone
+
+from .models import Item
+from .services import ItemCatalogService
+
+
+@shared_task
+def delete_item_image_files_task(names):
+    for name in names:
+        try:
+            default_storage.delete(name)
+        except Exception as e:
+            logger.error(f"아이템 이미지 파일 삭제 실패: {name}, 에러: {str(e)}")
+
+
+@shared_task
+def generate_item_image_variants_task(item_id, stale_names=()):
+    item = Item.objects.filter(id=item_id).first()
+    if item is None or not item.image:
+        delete_item_image_files_task(stale_names)
+        return
+
+    storage = item.image.storage
+    image_variants = {}
+    try:
+        with item.image.open("rb") as image_file:
+            data = image_file.read()
+
+        for variant, name, content, _ in build_image_variants(item.image.name, data):
+            # 내용 해시가 포함된 경로이므로 이미 있으면 다시 올리지 않는다.
+            if not storage.exists(name):
+                name = storage.save(name, ContentFile(content))
+            image_variants[variant] = name
+    except Exception as e:
+        logger.error(f"아이템 이미지 variant 생성 실패: {item_id}, 에러: {str(e)}")
+    else:
+        # 작업 중에 이미지가 바뀌었으면 덮어쓰지 않는다.
+        Item.objects.filter(id=item_id, image=item.image.name).update(
+            image_variants=image_variants, updated_at=timezone.now()
+        )
+        # update()는 시그널을 보내지 않으므로 상점 목록 캐시 버전을 직접 올린다.
+        ItemCatalogService.catalog.bump()
+
+    # 새 variant 저장이 끝난 뒤 이전 이미지의 variant 파일을 지운다.
+    delete_item_image_files_task(
+        [name for name in stale_names if name not in image_variants.values()]
+    )
@@ -7,6 +7,7 @@ from rest_framework.response import Response
 
 from ..models import Item
 from ..serializers import ItemImageUploadSerializer, ItemSerializer
+from .user_item_views import OwnedItemIdsMixin
 
 
 # 아이템 리스트 조회 및 등록
@@ -20,7 +21,7 @@ from ..serializers import ItemImageUploadSerializer, ItemSerializer
         403: OpenApiResponse(description="관리자 권한 없음"),
     },
 )
-class AdminItemListView(generics.ListCreateAPIView):
+class AdminItemListView(OwnedItemIdsMixin, generics.ListCreateAPIView):
     permission_classes = [IsAdminUser]
     serializer_class = ItemSerializer
     queryset = Item.objects.all()
@@ -1,4 +1,5 @@
 from coins.models import Coin
+from common.conditional import conditional_get, make_etag
 from django.db import transaction
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
@@ -8,6 +9,27 @@ from rest_framework.response import Response
 
 from ..models import Item, UserItem
 from ..serializers import ItemPurchaseSerializer, ItemSerializer, UserItemSerializer
+from ..services import ItemCatalogService
+
+
+class OwnedItemIdsMixin:
+    # 요청 사용자가 보유한 아이템 ID를 한 번만 조회해서 serializer에 넘겨준다.
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        user = self.request.user
+        context["owned_item_ids"] = (
+            ItemCatalogService.get_owned_item_ids(user.id)
+            if user.is_authenticated
+            else set()
+        )
+        return context
+
+
+def item_list_etag(request):
+    # 공용 카탈로그 버전과 요청 사용자의 보유 아이템으로 ETag 계산 (DB 조회 없음)
+    catalog = ItemCatalogService.get_catalog()
+    owned_item_ids = ItemCatalogService.get_owned_item_ids(request.user.id)
+    return make_etag(catalog["etag"], sorted(owned_item_ids))
 
 
 # 사용자용 아이템 리스트
@@ -20,11 +42,22 @@ from ..serializers import ItemPurchaseSerializer, ItemSerializer, UserItemSerial
         404: OpenApiResponse(description="아이템을 찾을 수 없음"),
     },
 )
+@conditional_get(etag_func=item_list_etag)
 class ItemListView(generics.ListAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = ItemSerializer
     queryset = Item.objects.all()
 
+    def list(self, request, *args, **kwargs):
+        # 공용 캐시의 직렬화 결과에 사용자별 구매 여부만 합쳐서 반환
+        catalog = ItemCatalogService.get_catalog()
+        owned_item_ids = ItemCatalogService.get_owned_item_ids(request.user.id)
+        data = [
+            ItemCatalogService.build_item_data(request, item, owned_item_ids)
+            for item in catalog["data"]
+        ]
+        return Response(data, status=status.HTTP_200_OK)
+
 
 # 특정 아이템 상세 정보
 @extend_schema(
@@ -45,7 +78,7 @@ class ItemListView(generics.ListAPIView):
         404: OpenApiResponse(description="아이템을 찾을 수 없음"),
     },
 )
-class ItemDetailView(generics.RetrieveAPIView):
+class ItemDetailView(OwnedItemIdsMixin, generics.RetrieveAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = ItemSerializer
     lookup_field = "id"
@@ -116,9 +149,9 @@ class ItemPurchaseView(generics.CreateAPIView):
         404: OpenApiResponse(description="사용자를 찾을 수 없음"),
     },
 )
-class UserItemPurchaseLogView(generics.ListAPIView):
+class UserItemPurchaseLogView(OwnedItemIdsMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = UserItemSerializer
 
     def get_queryset(self):
-        return UserItem.objects.filter(user=self.request.user)
+        return UserItem.objects.filter(user=self.request.user).select_related("item")
@@ -1,10 +1,27 @@
+import asyncio
 import json
+from urllib.parse import parse_qs
 
+from asgiref.sync import sync_to_async
+from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
+from common.logger import logger
+from django.conf import settings
+
+from .models import Notification
+from .services import NotificationService, PresenceService
 
 
 class NotificationConsumer(AsyncWebsocketConsumer):
+    group_name = None
+    presence_task = None
+
     async def connect(self):
+        # JWT 인증에 실패한 연결은 거부
+        if not self.scope["user"].is_authenticated:
+            await self.close()
+            return
+
         # 그룹 이름 생성 (유저 ID 기반)
         self.group_name = f"user_{self.scope['user'].id}"
 
@@ -14,17 +31,88 @@ class NotificationConsumer(AsyncWebsocketConsumer):
             self.channel_name,
         )
         await self.accept()
+        await self.touch_presence()
+        # 클라이언트 heartbeat 없이도 연결이 유지되는 동안 접속 상태를 갱신
+        self.presence_task = asyncio.create_task(self.keep_presence())
+
+        # 연결이 끊긴 동안 놓친 알림을 한 번에 전송
+        last_id = self.get_last_id()
+        if last_id is not None:
+            await self.send_missed_notifications(last_id)
 
     async def disconnect(self, close_code):
+        if self.group_name is None:
+            return
+        if self.presence_task is not None:
+            self.presence_task.cancel()
+        await sync_to_async(PresenceService.leave, thread_sensitive=False)(
+            self.scope["user"].id, self.channel_name
+        )
         # 그룹에서 유저 제거
         await self.channel_layer.group_discard(
             self.group_name,
             self.channel_name,
         )
 
+    # 클라이언트가 보내는 메시지(heartbeat 등)를 받을 때도 접속 상태 갱신
+    async def receive(self, text_data=None, bytes_data=None):
+        await self.touch_presence()
+
+    async def touch_presence(self):
+        # 재연결이 몰릴 때 메인 스레드 하나로 몰리지 않도록 별도 스레드에서 실행
+        await sync_to_async(PresenceService.touch, thread_sensitive=False)(
+            self.scope["user"].id, self.channel_name
+        )
+
+    async def keep_presence(self):
+        while True:
+            await asyncio.sleep(settings.PRESENCE_REFRESH_INTERVAL)
+            try:
+                await self.touch_presence()
+            except Exception as e:
+                # 일시적인 Redis 오류로 갱신이 멈추지 않도록 다음 주기에 다시 시도
+                logger.warning(f"접속 상태 갱신 실패: {self.channel_name}, 에러: {e}")
+
     # 메시지 수신 시 실행
     async def send_notification(self, event):
         message = event["message"]
 
         # 클라이언트로 메시지 전송
         await self.send(text_data=json.dumps(message))
+
+    def get_last_id(self):
+        # ws/notifications/?last_id=<마지막으로 받은 알림 ID>
+        query = parse_qs(self.scope.get("query_string", b"").decode())
+        try:
+            return int(query["last_id"][0])
+        except (KeyError, ValueError):
+            return None
+
+    async def send_missed_notifications(self, last_id):
+        notifications, has_more = await self.get_missed_notifications(last_id)
+        await self.send(
+            text_data=json.dumps(
+                {
+                    "type": "replay",
+                    "notifications": notifications,
+                    # 남은 알림이 더 있으면 클라이언트가 알림 목록 API로 이어서 조회
+                    "has_more": has_more,
+                }
+            )
+        )
+
+    @database_sync_to_async
+    def get_missed_notifications(self, last_id):
+        limit = settings.NOTIFICATION_REPLAY_LIMIT
+        notifications = list(
+            Notification.objects.filter(
+                user=self.scope["user"], id__gt=last_id
+            ).order_by("id")[: limit + 1]
+        )
+        return (
+            [
+                NotificationService.build_payload(notification)
+                for notification in notifications[:limit]
+            ],
+            len(notifications) > limit,
+        )
@@ -0,0 +1,23 @@
+# Generated by Django 5.1 on 2026-10-19 18:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0003_notificationoutbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='count',
+            field=models.PositiveIntegerField(default=1),
+        ),
+        migrations.AlterField(
+            model_name='notification',
+            name='type',
+            field=models.CharField(choices=[('follow_request', 'Follow Request'), ('guestbook_entry', 'Guestbook Entry'), ('level_up', 'Level Up'), ('attendance', 'Attendance'), ('digest', 'Digest')], max_length=50),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from common.models import TimeStampModel
 from django.db import models
+from django.utils import timezone
 from users.models import User
 
 
@@ -8,6 +9,8 @@ class Notification(TimeStampModel):
         ("follow_request", "Follow Request"),
         ("guestbook_entry", "Guestbook Entry"),
         ("level_up", "Level Up"),
+        ("attendance", "Attendance"),
+        ("digest", "Digest"),
     ]
 
     user = models.ForeignKey(
@@ -17,6 +20,56 @@ class Notification(TimeStampModel):
     related_id = models.BigIntegerField(null=True, blank=True)
     message = models.TextField(null=False)
     is_read = models.BooleanField(default=False)
+    # 짧은 시간 안에 합쳐진 같은 종류의 이벤트 수 (예: 5명이 팔로우)
+    count = models.PositiveIntegerField(default=1)
+    # 합치는 알림의 종류와 시간 구간 (예: "follow_request:28811234"), 합치지 않는 알림은 null
+    coalesce_key = models.CharField(max_length=100, null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # 사용자별 알림함 커서 페이지네이션용
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                name="notification_user_created_idx",
+            ),
+            # 읽지 않은 알림만 조회할 때 사용
+            models.Index(
+                fields=["user", "-created_at", "-id"],
+                condition=models.Q(is_read=False),
+                name="notification_unread_idx",
+            ),
+            # 웹소켓 재연결 시 마지막으로 받은 알림 이후를 조회할 때 사용
+            models.Index(fields=["user", "id"], name="notification_user_id_idx"),
+        ]
+        constraints = [
+            # 같은 구간에 합쳐질 읽지 않은 알림은 하나만 존재
+            models.UniqueConstraint(
+                fields=["user", "coalesce_key"],
+                condition=models.Q(is_read=False),
+                name="unique_unread_coalesce_key",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.username} - {self.type}: {self.message[:20]}"
+
+
+class NotificationOutbox(models.Model):
+    # 웹소켓으로 보낼 알림. 알림과 같은 트랜잭션에서 저장하고 커밋 후 dispatcher 가 전송한다.
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="notification_outbox"
+    )
+    payload = models.JSONField()
+    attempts = models.PositiveSmallIntegerField(default=0)
+    available_at = models.DateTimeField(default=timezone.now)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=["available_at", "id"], name="notification_outbox_ready_idx"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} - {self.payload.get('type')} ({self.attempts})"
@@ -13,7 +13,23 @@ class NotificationSerializer(serializers.ModelSerializer):
             "related_id",
             "message",
             "is_read",
+            "count",
             "created_at",
             "updated_at",
         ]
         read_only_fields = ["created_at", "updated_at"]
+
+
+class NotificationMarkReadSerializer(serializers.Serializer):
+    before_id = serializers.IntegerField(
+        required=False, help_text="이 ID 이하의 알림을 읽음 처리"
+    )
+    before = serializers.DateTimeField(
+        required=False, help_text="이 시각 이전에 받은 알림을 읽음 처리"
+    )
+
+
+class NotificationBulkDeleteSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(), allow_empty=False, max_length=500
+    )
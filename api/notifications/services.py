@@ -1,8 +1,184 @@
-from notifications.models import Notification
+import asyncio
+import time
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from channels.layers import get_channel_layer
 from coins.models import Coin
+from common.logger import logger
+from common.redis_client import get_redis
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from notifications.models import Notification, NotificationOutbox
 
 
 class NotificationService:
+    # 합치는 도중 다른 작업이 같은 구간의 첫 알림을 만들었을 때 다시 시도하는 횟수
+    COALESCE_ATTEMPTS = 3
+
+    # 알림 생성. 웹소켓 전송은 같은 트랜잭션에서 outbox 에 기록하고 커밋 후 dispatcher 가 처리
+    @staticmethod
+    @transaction.atomic
+    def notify(user, type, message, related_id=None):
+        notification = Notification.objects.create(
+            user=user, type=type, related_id=related_id, message=message
+        )
+        NotificationService.push(notification)
+        return notification
+
+    @staticmethod
+    def push(notification):
+        NotificationOutbox.objects.create(
+            user_id=notification.user_id,
+            payload=NotificationService.build_payload(notification),
+        )
+        OutboxDispatcher.schedule()
+
+    @staticmethod
+    def build_payload(notification):
+        return {
+            "id": notification.id,
+            "type": notification.type,
+            "message": notification.message,
+            "is_read": notification.is_read,
+            "count": notification.count,
+            "created_at": notification.created_at.isoformat(),
+        }
+
+    @staticmethod
+    def push_many(notifications):
+        # 여러 알림의 outbox 행을 한 번에 기록
+        if notifications:
+            NotificationOutbox.objects.bulk_create(
+                NotificationOutbox(
+                    user_id=notification.user_id,
+                    payload=NotificationService.build_payload(notification),
+                )
+                for notification in notifications
+            )
+            OutboxDispatcher.schedule()
+
+    @staticmethod
+    def notify_coalesced(user_ids, type, message, related_id=None):
+        """
+        같은 사용자에게 짧은 시간 안에 반복되는 같은 종류의 알림을 하나로 합친다.
+        message 는 "{count}명이 팔로우했습니다." 처럼 합쳐진 수를 넣는 형식 문자열이다.
+        요청 트랜잭션이 알림 행을 잠근 채로 기다리지 않도록 커밋된 뒤 작업에서 합친다.
+        """
+        from .tasks import coalesce_notifications_task
+
+        user_ids = list(user_ids)
+        if user_ids:
+            transaction.on_commit(
+                lambda: coalesce_notifications_task.delay(
+                    user_ids, type, message, related_id
+                )
+            )
+
+    @classmethod
+    def coalesce(cls, user_ids, type, message, related_id=None):
+        """
+        notify_coalesced 로 예약된 알림을 사용자들에게 한 번에 합쳐서 만든다.
+        첫 알림은 바로 보내고, 합쳐진 알림은 window 가 끝날 때 한 번 더 보낸다.
+        NOTIFICATION_DIGEST_TYPES 에 포함된 종류는 주기적인 요약 알림으로 모아서 보낸다.
+        """
+        # 사용자 id 순서로 잠그고 추가해서 동시에 합치는 작업끼리 교착되지 않게 한다.
+        user_ids = sorted(set(user_ids))
+        if type in settings.NOTIFICATION_DIGEST_TYPES:
+            for user_id in user_ids:
+                DigestService.add(user_id, type)
+            return []
+
+        window = settings.NOTIFICATION_COALESCE_WINDOW
+        bucket = int(time.time()) // window
+        coalesce_key = f"{type}:{bucket}"
+        for attempt in range(cls.COALESCE_ATTEMPTS):
+            try:
+                with transaction.atomic():
+                    return cls._coalesce(
+                        user_ids,
+                        type,
+                        message,
+                        related_id,
+                        coalesce_key,
+                        (bucket + 1) * window,
+                    )
+            except IntegrityError:
+                # 다른 작업이 같은 구간의 첫 알림을 먼저 만들었으면 다시 읽어서 합친다.
+                if attempt + 1 >= cls.COALESCE_ATTEMPTS:
+                    raise
+
+    @classmethod
+    def _coalesce(cls, user_ids, type, message, related_id, coalesce_key, flush_at):
+        # window 단위 구간마다 읽지 않은 알림은 하나만 존재하도록 DB 제약으로 보장한다.
+        merged = list(
+            Notification.objects.select_for_update()
+            .filter(user_id__in=user_ids, coalesce_key=coalesce_key, is_read=False)
+            .order_by("user_id")
+        )
+        now = timezone.now()
+        for notification in merged:
+            notification.count += 1
+            notification.message = message.format(count=notification.count)
+            notification.related_id = related_id
+            notification.updated_at = now
+        Notification.objects.bulk_update(
+            merged, ["count", "message", "related_id", "updated_at"]
+        )
+
+        merged_user_ids = {notification.user_id for notification in merged}
+        # bulk_create 는 post_save 를 보내지 않으므로 카운터와 outbox 를 직접 처리
+        created = Notification.objects.bulk_create(
+            Notification(
+                user_id=user_id,
+                type=type,
+                related_id=related_id,
+                message=message.format(count=1),
+                coalesce_key=coalesce_key,
+            )
+            for user_id in user_ids
+            if user_id not in merged_user_ids
+        )
+        for notification in created:
+            UnreadCountService.adjust_on_commit(notification.user_id, 1)
+        cls.push_many(created)
+        cls.schedule_flush([notification.id for notification in created], flush_at)
+        return merged + created
+
+    @classmethod
+    def notify_followed(cls, follower_id, followed_ids):
+        # 단건 팔로우는 post_save 시그널에서, 일괄 팔로우는 뷰에서 직접 호출
+        cls.notify_coalesced(
+            followed_ids,
+            type="follow_request",
+            related_id=follower_id,
+            message="{count}명이 회원님을 팔로우했습니다.",
+        )
+
+    @staticmethod
+    def schedule_flush(notification_ids, flush_at):
+        # window 구간이 끝난 뒤 합쳐진 알림을 한 번 더 전송
+        from .tasks import push_coalesced_notification_task
+
+        if notification_ids:
+            transaction.on_commit(
+                lambda: push_coalesced_notification_task.apply_async(
+                    args=[notification_ids], countdown=max(flush_at - time.time(), 0)
+                )
+            )
+
+    @staticmethod
+    @transaction.atomic
+    def push_coalesced(notification_ids):
+        notifications = list(
+            Notification.objects.filter(
+                id__in=notification_ids, is_read=False, count__gt=1
+            )
+        )
+        NotificationService.push_many(notifications)
+        return notifications
+
     @staticmethod
     def create_attendance_notification(attendance):
         user = attendance.user
@@ -27,3 +203,360 @@ class NotificationService:
             "is_read": recent_notification.is_read,
             "created_at": recent_notification.created_at.isoformat(),
         }
+
+
+class UnreadCountService:
+    """
+    사용자별 읽지 않은 알림 수를 Redis 카운터로 관리한다.
+    카운터가 없을 때 DB에서 세어 채우고, 이후에는 알림 생성/읽음/삭제 시 증감한다.
+    카운터는 NOTIFICATION_UNREAD_COUNT_TIMEOUT 마다 만료되어 DB 값으로 다시 맞춰진다.
+    """
+
+    UNREAD_KEY = "notification_unread:{user_id}"
+    # 카운터가 없을 때 들어온 증감 횟수. DB에서 세는 동안 바뀌면 센 값을 저장하지 않는다.
+    GENERATION_KEY = "notification_unread_generation:{user_id}"
+    # 커밋 전에 표시하고 커밋 후 증감할 때 지우는 진행 중인 변경 수.
+    # 진행 중인 변경이 있으면 DB에서 센 값에 이미 반영됐을 수 있으므로 채우지 않는다.
+    PENDING_KEY = "notification_unread_pending:{user_id}"
+    # 롤백되어 지워지지 않은 표시는 이 시간이 지나면 사라진다.
+    PENDING_TIMEOUT = 60
+    # 카운터가 있을 때만 증감하고 0 아래로 내려가지 않도록 한다.
+    # 카운터가 없으면 세대 값을 올려서 진행 중인 채우기가 오래된 값을 저장하지 않게 한다.
+    ADJUST_SCRIPT = """
+    if ARGV[3] == "1" and tonumber(redis.call("GET", KEYS[3]) or "0") > 0 then
+        redis.call("DECR", KEYS[3])
+    end
+    if redis.call("EXISTS", KEYS[1]) == 0 then
+        redis.call("INCR", KEYS[2])
+        redis.call("EXPIRE", KEYS[2], ARGV[2])
+        return nil
+    end
+    local count = redis.call("INCRBY", KEYS[1], ARGV[1])
+    if count < 0 then
+        redis.call("SET", KEYS[1], 0, "KEEPTTL")
+        return 0
+    end
+    return count
+    """
+    # 세는 동안 세대 값이 그대로이고 진행 중인 변경이 없을 때만 카운터를 채운다.
+    FILL_SCRIPT = """
+    if (redis.call("GET", KEYS[2]) or "") ~= ARGV[1] then
+        return nil
+    end
+    if tonumber(redis.call("GET", KEYS[3]) or "0") > 0 then
+        return nil
+    end
+    redis.call("SET", KEYS[1], ARGV[2], "EX", ARGV[3], "NX")
+    return redis.call("GET", KEYS[1])
+    """
+
+    @classmethod
+    def get_keys(cls, user_id):
+        return (
+            cls.UNREAD_KEY.format(user_id=user_id),
+            cls.GENERATION_KEY.format(user_id=user_id),
+            cls.PENDING_KEY.format(user_id=user_id),
+        )
+
+    @classmethod
+    def get_count(cls, user_id):
+        redis = get_redis()
+        keys = cls.get_keys(user_id)
+        count = redis.get(keys[0])
+        if count is not None:
+            return int(count)
+
+        generation = redis.get(keys[1]) or ""
+        count = Notification.objects.filter(user_id=user_id, is_read=False).count()
+        stored = redis.eval(
+            cls.FILL_SCRIPT,
+            3,
+            *keys,
+            generation,
+            count,
+            settings.NOTIFICATION_UNREAD_COUNT_TIMEOUT,
+        )
+        # 세는 동안 알림이 바뀌었으면 저장하지 않고 이번에 센 값만 반환한다.
+        return int(stored) if stored is not None else count
+
+    @classmethod
+    def adjust(cls, user_id, amount, pending=False):
+        if amount:
+            get_redis().eval(
+                cls.ADJUST_SCRIPT,
+                3,
+                *cls.get_keys(user_id),
+                amount,
+                settings.NOTIFICATION_UNREAD_COUNT_TIMEOUT,
+                "1" if pending else "0",
+            )
+
+    @classmethod
+    def adjust_on_commit(cls, user_id, amount):
+        # 커밋 전에 진행 중 표시를 남겨서, 커밋과 증감 사이에 DB에서 센 값이
+        # 카운터로 저장된 뒤 같은 변경이 한 번 더 더해지지 않게 한다.
+        if amount:
+            pending_key = cls.PENDING_KEY.format(user_id=user_id)
+            pipeline = get_redis().pipeline()
+            pipeline.incr(pending_key)
+            pipeline.expire(pending_key, cls.PENDING_TIMEOUT)
+            pipeline.execute()
+            transaction.on_commit(lambda: cls.adjust(user_id, amount, pending=True))
+
+    @classmethod
+    def reset(cls, user_id):
+        get_redis().delete(cls.UNREAD_KEY.format(user_id=user_id))
+
+
+class InboxService:
+    """
+    알림함 일괄 처리. 요청한 사용자의 알림만 한 번의 UPDATE/DELETE 로 처리하고
+    실제로 바뀐 읽지 않은 알림 수만큼 카운터를 줄인다.
+    """
+
+    @staticmethod
+    def mark_read(user_id, before_id=None, before=None):
+        queryset = Notification.objects.filter(user_id=user_id, is_read=False)
+        if before_id is not None:
+            queryset = queryset.filter(id__lte=before_id)
+        if before is not None:
+            queryset = queryset.filter(created_at__lte=before)
+        updated = queryset.update(is_read=True)
+        UnreadCountService.adjust_on_commit(user_id, -updated)
+        return updated
+
+    @staticmethod
+    @transaction.atomic
+    def delete(user_id, ids):
+        queryset = Notification.objects.filter(user_id=user_id, id__in=ids)
+        # 읽지 않은 알림을 먼저 지워서 카운터에서 뺄 수를 정확히 구한다.
+        unread_deleted, _ = queryset.filter(is_read=False).delete()
+        read_deleted, _ = queryset.delete()
+        UnreadCountService.adjust_on_commit(user_id, -unread_deleted)
+        return unread_deleted + read_deleted
+
+
+class OutboxDispatcher:
+    """
+    NotificationOutbox 에 쌓인 알림을 채널 레이어로 전송한다.
+    여러 worker 가 동시에 실행돼도 skip_locked 로 서로 다른 행을 가져가고,
+    전송에 실패한 알림은 점점 긴 간격으로 다시 시도한다.
+    """
+
+    @staticmethod
+    def schedule():
+        # 알림 생성 트랜잭션이 커밋된 뒤 전송 (롤백되면 outbox 행도 함께 사라진다)
+        from .tasks import dispatch_notification_outbox_task
+
+        transaction.on_commit(lambda: dispatch_notification_outbox_task.delay())
+
+    @classmethod
+    def dispatch(cls):
+        batch_size = settings.NOTIFICATION_OUTBOX_BATCH_SIZE
+        max_attempts = settings.NOTIFICATION_OUTBOX_MAX_ATTEMPTS
+        sent = 0
+        while True:
+            with transaction.atomic():
+                entries = list(
+                    NotificationOutbox.objects.select_for_update(skip_locked=True)
+                    .filter(available_at__lte=timezone.now())
+                    .order_by("id")[:batch_size]
+                )
+                if not entries:
+                    break
+                fetched = len(entries)
+
+                # 접속 중이 아닌 사용자의 알림은 보내지 않고 알림함 조회에 맡긴다.
+                online_ids = PresenceService.get_online_user_ids(
+                    {entry.user_id for entry in entries}
+                )
+                done_ids = [
+                    entry.id for entry in entries if entry.user_id not in online_ids
+                ]
+                entries = [entry for entry in entries if entry.user_id in online_ids]
+
+                errors = async_to_sync(cls.send_batch)(entries)
+                retry_entries = []
+                for entry, error in zip(entries, errors):
+                    if error is None:
+                        sent += 1
+                        done_ids.append(entry.id)
+                    elif entry.attempts + 1 >= max_attempts:
+                        logger.error(f"알림 전송 재시도 초과: {entry.id}, 에러: {error}")
+                        done_ids.append(entry.id)
+                    else:
+                        entry.attempts += 1
+                        entry.available_at = timezone.now() + timedelta(
+                            seconds=settings.NOTIFICATION_OUTBOX_RETRY_DELAY
+                            * 2**entry.attempts
+                        )
+                        retry_entries.append(entry)
+
+                NotificationOutbox.objects.filter(id__in=done_ids).delete()
+                NotificationOutbox.objects.bulk_update(
+                    retry_entries, ["attempts", "available_at"]
+                )
+            if fetched < batch_size:
+                break
+        return sent
+
+    @staticmethod
+    async def send_batch(entries):
+        # 배치의 알림을 동시에 전송하고 알림별 에러(성공 시 None)를 반환
+        channel_layer = get_channel_layer()
+        if channel_layer is None:
+            return [None] * len(entries)
+        results = await asyncio.gather(
+            *(
+                channel_layer.group_send(
+                    f"user_{entry.user_id}",
+                    {"type": "send_notification", "message": entry.payload},
+                )
+                for entry in entries
+            ),
+            return_exceptions=True,
+        )
+        return [
+            result if isinstance(result, Exception) else None for result in results
+        ]
+
+
+class DigestService:
+    """
+    NOTIFICATION_DIGEST_TYPES 종류의 알림은 바로 만들지 않고 Redis 에 종류별 개수만 모아 두었다가,
+    주기적으로 사용자마다 하나의 요약 알림으로 만든다.
+    """
+
+    USERS_KEY = "notification_digest:users"
+    DIGEST_KEY = "notification_digest:{user_id}"
+    BATCH_SIZE = 500
+
+    @classmethod
+    def add(cls, user_id, type):
+        pipeline = get_redis().pipeline()
+        pipeline.hincrby(cls.DIGEST_KEY.format(user_id=user_id), type, 1)
+        pipeline.sadd(cls.USERS_KEY, user_id)
+        pipeline.execute()
+
+    @staticmethod
+    def build_message(counts):
+        labels = dict(Notification.TYPE_CHOICES)
+        summary = ", ".join(
+            f"{labels.get(type, type)} {count}건" for type, count in counts.items()
+        )
+        return f"새 알림 {sum(counts.values())}건: {summary}"
+
+    @classmethod
+    def send_digests(cls):
+        redis = get_redis()
+        sent = 0
+        while True:
+            user_ids = redis.spop(cls.USERS_KEY, cls.BATCH_SIZE)
+            if not user_ids:
+                break
+
+            # 읽는 사이에 추가된 개수를 잃지 않도록 조회와 삭제를 한 트랜잭션으로 처리
+            pipeline = redis.pipeline()
+            for user_id in user_ids:
+                key = cls.DIGEST_KEY.format(user_id=user_id)
+                pipeline.hgetall(key)
+                pipeline.delete(key)
+            digests = pipeline.execute()[::2]
+
+            notifications = [
+                Notification(
+                    user_id=int(user_id),
+                    type="digest",
+                    message=cls.build_message(counts),
+                    count=sum(counts.values()),
+                )
+                for user_id, counts in zip(
+                    user_ids,
+                    (
+                        {type: int(count) for type, count in digest.items()}
+                        for digest in digests
+                    ),
+                )
+                if counts
+            ]
+            with transaction.atomic():
+                # bulk_create 는 post_save 를 보내지 않으므로 카운터와 outbox 를 직접 처리
+                notifications = Notification.objects.bulk_create(notifications)
+                NotificationOutbox.objects.bulk_create(
+                    NotificationOutbox(
+                        user_id=notification.user_id,
+                        payload=NotificationService.build_payload(notification),
+                    )
+                    for notification in notifications
+                )
+                for notification in notifications:
+                    UnreadCountService.adjust_on_commit(notification.user_id, 1)
+                OutboxDispatcher.schedule()
+            sent += len(notifications)
+        return sent
+
+
+class PresenceService:
+    """
+    웹소켓 접속 상태. 사용자별 sorted set 에 연결(channel_name)마다 마지막 갱신 시각을 두고,
+    전체 접속자 sorted set 에는 사용자별 마지막 갱신 시각을 둔다.
+    consumer 가 연결되어 있는 동안 주기적으로 갱신하며,
+    PRESENCE_TIMEOUT 동안 갱신되지 않은 연결(서버가 비정상 종료된 경우 등)은 끊긴 것으로 본다.
+    """
+
+    CONNECTIONS_KEY = "presence:user:{user_id}"
+    ONLINE_KEY = "presence:online"
+    # 연결을 지우고 남은 연결이 없을 때만 접속자 목록에서 제거 (다른 탭의 touch 와 섞이지 않도록)
+    LEAVE_SCRIPT = """
+    redis.call("ZREM", KEYS[1], ARGV[1])
+    redis.call("ZREMRANGEBYSCORE", KEYS[1], "-inf", ARGV[2])
+    if redis.call("ZCARD", KEYS[1]) > 0 then
+        return 1
+    end
+    redis.call("ZREM", KEYS[2], ARGV[3])
+    return 0
+    """
+
+    @classmethod
+    def touch(cls, user_id, channel_name):
+        # 연결 시와 연결이 유지되는 동안 주기적으로 호출
+        now = time.time()
+        key = cls.CONNECTIONS_KEY.format(user_id=user_id)
+        pipeline = get_redis().pipeline()
+        pipeline.zadd(key, {channel_name: now})
+        pipeline.expire(key, settings.PRESENCE_TIMEOUT)
+        pipeline.zadd(cls.ONLINE_KEY, {user_id: now})
+        pipeline.execute()
+
+    @classmethod
+    def leave(cls, user_id, channel_name):
+        get_redis().eval(
+            cls.LEAVE_SCRIPT,
+            2,
+            cls.CONNECTIONS_KEY.format(user_id=user_id),
+            cls.ONLINE_KEY,
+            channel_name,
+            time.time() - settings.PRESENCE_TIMEOUT,
+            user_id,
+        )
+
+    @classmethod
+    def get_online_user_ids(cls, user_ids):
+        user_ids = list(user_ids)
+        if not user_ids:
+            return set()
+        scores = get_redis().zmscore(cls.ONLINE_KEY, user_ids)
+        since = time.time() - settings.PRESENCE_TIMEOUT
+        return {
+            user_id
+            for user_id, score in zip(user_ids, scores)
+            if score is not None and score > since
+        }
+
+    @classmethod
+    def get_online_count(cls):
+        redis = get_redis()
+        since = time.time() - settings.PRESENCE_TIMEOUT
+        # 갱신이 끊긴 사용자는 정리한 뒤 센다.
+        redis.zremrangebyscore(cls.ONLINE_KEY, "-inf", since)
+        return redis.zcard(cls.ONLINE_KEY)
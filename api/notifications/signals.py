@@ -1,38 +1,54 @@
-from asgiref.sync import async_to_sync
-from channels.layers import get_channel_layer
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
+
 #출석 기록이 생성되면 알림을 생성하고 웹소켓을 통해 클라이언트에 push.
 @receiver(post_save, sender="attendances.Attendance")  # 모델 이름으로 지정
 def handle_attendance_notification(sender, instance, created, **kwargs):
     
     if created:
         # 지연 임포트를 사용하여 순환 참조 방지
-        from attendances.models import Attendance
-        from notifications.models import Notification
+        from notifications.services import NotificationService
 
         # 출석 기록이 성공적으로 생성되었을 때 알림 생성
-        notification = Notification.objects.create(
+        # 웹소켓 push 는 outbox 에 기록되어 출석 트랜잭션이 커밋된 뒤 전송된다.
+        NotificationService.notify(
             user=instance.user,
             type="attendance",
             related_id=instance.id,
             message=f"코인이 지급되었습니다.",
         )
 
-        # 웹소켓으로 알림 데이터 푸시
-        channel_layer = get_channel_layer()
-        if channel_layer:  # 채널 레이어가 설정된 경우에만 실행
-            async_to_sync(channel_layer.group_send)(
-                f"user_{instance.user.id}",  # 유저 ID를 그룹명으로 사용
-                {
-                    "type": "send_notification",  # consumer에서 처리할 메서드 이름
-                    "message": {
-                        "id": notification.id,
-                        "type": notification.type,
-                        "message": notification.message,
-                        "is_read": notification.is_read,
-                        "created_at": notification.created_at.isoformat(),
-                    },
-                },
-            )
+
+# 읽지 않은 알림이 생기면 읽지 않은 알림 수 카운터 반영
+# (삭제는 InboxService 에서 처리해서 post_delete 시그널 없이 한 번에 DELETE 되도록 함)
+@receiver(post_save, sender="notifications.Notification")
+def increase_unread_count(sender, instance, created, **kwargs):
+    if created and not instance.is_read:
+        from notifications.services import UnreadCountService
+
+        UnreadCountService.adjust_on_commit(instance.user_id, 1)
+
+
+# 팔로우, 방명록처럼 몰려서 생길 수 있는 알림은 커밋 이후 짧은 시간 단위로 합쳐서 보낸다.
+@receiver(post_save, sender="follows.Follow")
+def handle_follow_notification(sender, instance, created, **kwargs):
+    if created:
+        from notifications.services import NotificationService
+
+        NotificationService.notify_followed(
+            instance.follower_id, [instance.followed_id]
+        )
+
+
+@receiver(post_save, sender="guestbooks.Guestbook")
+def handle_guestbook_notification(sender, instance, created, **kwargs):
+    if created and instance.host_id != instance.guest_id:
+        from notifications.services import NotificationService
+
+        NotificationService.notify_coalesced(
+            [instance.host_id],
+            type="guestbook_entry",
+            related_id=instance.id,
+            message="방명록에 새 글이 {count}개 작성되었습니다.",
+        )
@@ -0,0 +1,23 @@
+from celery import shared_task
+
+from .services import DigestService, NotificationService, OutboxDispatcher
+
+
+@shared_task
+def dispatch_notification_outbox_task():
+    return OutboxDispatcher.dispatch()
+
+
+@shared_task
+def coalesce_notifications_task(user_ids, type, message, related_id=None):
+    NotificationService.coalesce(user_ids, type, message, related_id)
+
+
+@shared_task
+def push_coalesced_notification_task(notification_ids):
+    NotificationService.push_coalesced(notification_ids)
+
+
+@shared_task
+def send_notification_digests_task():
+    return DigestService.send_digests()
@@ -1,14 +1,32 @@
 from django.urls import path
 from notifications.views import (
+    NotificationBulkDeleteView,
+    NotificationBulkReadView,
     NotificationDetailView,
     NotificationListView,
+    NotificationOnlineCountView,
     NotificationStatusView,
+    NotificationUnreadCountView,
 )
 
 urlpatterns = [
     path(
         "", NotificationListView.as_view(), name="notification-list"
     ),  # WebSocket 전용 (Socket.IO에서 처리 가능)
+    path(
+        "unread-count/",
+        NotificationUnreadCountView.as_view(),
+        name="notification-unread-count",
+    ),
+    path(
+        "online-count/",
+        NotificationOnlineCountView.as_view(),
+        name="notification-online-count",
+    ),
+    path("read/", NotificationBulkReadView.as_view(), name="notification-bulk-read"),
+    path(
+        "delete/", NotificationBulkDeleteView.as_view(), name="notification-bulk-delete"
+    ),
     path("<int:pk>/", NotificationDetailView.as_view(), name="notification-detail"),
     path(
         "<int:pk>/status/", NotificationStatusView.as_view(), name="notification-status"
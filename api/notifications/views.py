@@ -1,13 +1,156 @@
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
 from notifications.models import Notification
-from notifications.serializers import NotificationSerializer
+from notifications.serializers import (
+    NotificationBulkDeleteSerializer,
+    NotificationMarkReadSerializer,
+    NotificationSerializer,
+)
+from notifications.services import (
+    InboxService,
+    PresenceService,
+    UnreadCountService,
+)
 from rest_framework import generics, status
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.pagination import CursorPagination
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
 
-class NotificationStatusView(generics.UpdateAPIView, generics.DestroyAPIView):
-    queryset = Notification.objects.all()
+class NotificationCursorPagination(CursorPagination):
+    page_size = 20
+    ordering = ("-created_at", "-id")
+
+
+# 요청한 사용자의 알림만 조회/수정할 수 있도록 제한
+class UserNotificationMixin:
+    def get_queryset(self):
+        return Notification.objects.filter(user=self.request.user)
+
+
+@extend_schema(
+    summary="알림 목록 조회",
+    description="사용자에게 온 알림을 최신순으로 조회합니다. 응답의 next 링크로 다음 페이지를 조회합니다.",
+    parameters=[
+        OpenApiParameter(
+            name="unread",
+            description="true 이면 읽지 않은 알림만 조회",
+            required=False,
+            type=OpenApiTypes.BOOL,
+        ),
+    ],
+    responses={200: NotificationSerializer(many=True)},
+)
+class NotificationListView(UserNotificationMixin, generics.ListAPIView):
+    serializer_class = NotificationSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = NotificationCursorPagination
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.request.query_params.get("unread") in ("true", "1"):
+            queryset = queryset.filter(is_read=False)
+        return queryset
+
+
+class NotificationUnreadCountView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="읽지 않은 알림 수 조회",
+        description="알림 배지에 표시할 읽지 않은 알림 수를 반환합니다.",
+        responses={
+            200: OpenApiResponse(
+                response={
+                    "type": "object",
+                    "properties": {"unread_count": {"type": "integer"}},
+                },
+                description="읽지 않은 알림 수",
+            )
+        },
+    )
+    def get(self, request):
+        return Response(
+            {"unread_count": UnreadCountService.get_count(request.user.id)},
+            status=status.HTTP_200_OK,
+        )
+
+
+class NotificationOnlineCountView(APIView):
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary="웹소켓 접속자 수 조회",
+        description="현재 웹소켓에 접속 중인 사용자 수를 반환합니다. (관리자 전용)",
+        responses={
+            200: OpenApiResponse(
+                response={
+                    "type": "object",
+                    "properties": {"online_count": {"type": "integer"}},
+                },
+                description="접속 중인 사용자 수",
+            )
+        },
+    )
+    def get(self, request):
+        return Response(
+            {"online_count": PresenceService.get_online_count()},
+            status=status.HTTP_200_OK,
+        )
+
+
+class NotificationBulkReadView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="알림 일괄 읽음 처리",
+        description="before_id 또는 before 를 주면 그 이전 알림만, 주지 않으면 모든 알림을 읽음 처리합니다.",
+        request=NotificationMarkReadSerializer,
+        responses={
+            200: OpenApiResponse(
+                response={
+                    "type": "object",
+                    "properties": {"updated": {"type": "integer"}},
+                },
+                description="읽음 처리된 알림 수",
+            )
+        },
+    )
+    def post(self, request):
+        serializer = NotificationMarkReadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        updated = InboxService.mark_read(request.user.id, **serializer.validated_data)
+        return Response({"updated": updated}, status=status.HTTP_200_OK)
+
+
+class NotificationBulkDeleteView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        summary="알림 일괄 삭제",
+        description="전달한 ID 목록 중 사용자에게 온 알림을 삭제합니다.",
+        request=NotificationBulkDeleteSerializer,
+        responses={
+            200: OpenApiResponse(
+                response={
+                    "type": "object",
+                    "properties": {"deleted": {"type": "integer"}},
+                },
+                description="삭제된 알림 수",
+            )
+        },
+    )
+    def post(self, request):
+        serializer = NotificationBulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        deleted = InboxService.delete(request.user.id, serializer.validated_data["ids"])
+        return Response({"deleted": deleted}, status=status.HTTP_200_OK)
+
+
+class NotificationStatusView(
+    UserNotificationMixin, generics.UpdateAPIView, generics.DestroyAPIView
+):
     permission_classes = [IsAuthenticated]
 
     @extend_schema(
@@ -16,8 +159,13 @@ class NotificationStatusView(generics.UpdateAPIView, generics.DestroyAPIView):
     )
     def put(self, request, *args, **kwargs):
         notification = self.get_object()
-        notification.is_read = True
-        notification.save()
+        # 이미 읽은 알림이면 카운터를 다시 줄이지 않도록 읽지 않은 경우에만 갱신
+        updated = (
+            self.get_queryset()
+            .filter(id=notification.id, is_read=False)
+            .update(is_read=True)
+        )
+        UnreadCountService.adjust_on_commit(request.user.id, -updated)
         return Response(
             {"message": "Notification marked as read"}, status=status.HTTP_200_OK
         )
@@ -28,14 +176,13 @@ class NotificationStatusView(generics.UpdateAPIView, generics.DestroyAPIView):
     )
     def delete(self, request, *args, **kwargs):
         notification = self.get_object()
-        notification.delete()
+        InboxService.delete(request.user.id, [notification.id])
         return Response(
             {"message": "Notification deleted"}, status=status.HTTP_204_NO_CONTENT
         )
 
 
-class NotificationDetailView(generics.RetrieveAPIView):
-    queryset = Notification.objects.all()
+class NotificationDetailView(UserNotificationMixin, generics.RetrieveAPIView):
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated]
 
@@ -0,0 +1,47 @@
+# Generated by Django 5.1 on 2026-10-19 18:15
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('items', '0004_useritem_user_item_idx'),
+        ('potatoes', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserPresetItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='items.item')),
+                ('preset', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='preset_items', to='potatoes.userpreset')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='userpreset',
+            name='items',
+            field=models.ManyToManyField(blank=True, related_name='presets', through='potatoes.UserPresetItem', to='items.item'),
+        ),
+        migrations.CreateModel(
+            name='PotatoEquippedItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('deleted_at', models.DateTimeField(null=True)),
+                ('slot', models.CharField(max_length=50)),
+                ('item', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='equipped_potatoes', to='items.item')),
+                ('potato', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='equipped_items', to='potatoes.potato')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('potato', 'slot'), name='unique_potato_equipped_slot')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='userpresetitem',
+            constraint=models.UniqueConstraint(fields=('preset', 'item'), name='unique_user_preset_item'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+from django.db import migrations
+
+
+def move_item_ids_to_preset_items(apps, schema_editor):
+    # JSON 배열에 저장된 아이템 ID를 UserPresetItem 행으로 옮긴다 (존재하지 않는 아이템은 제외)
+    UserPreset = apps.get_model('potatoes', 'UserPreset')
+    UserPresetItem = apps.get_model('potatoes', 'UserPresetItem')
+    Item = apps.get_model('items', 'Item')
+
+    presets = list(UserPreset.objects.only('id', 'item_ids'))
+    requested_ids = {
+        item_id
+        for preset in presets
+        for item_id in (preset.item_ids or [])
+        if isinstance(item_id, int)
+    }
+    existing_ids = set(
+        Item.objects.filter(id__in=requested_ids).values_list('id', flat=True)
+    )
+    UserPresetItem.objects.bulk_create(
+        [
+            UserPresetItem(preset_id=preset.id, item_id=item_id)
+            for preset in presets
+            for item_id in dict.fromkeys(preset.item_ids or [])
+            if item_id in existing_ids
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def move_preset_items_to_item_ids(apps, schema_editor):
+    UserPreset = apps.get_model('potatoes', 'UserPreset')
+    for preset in UserPreset.objects.prefetch_related('items'):
+        preset.item_ids = [item.id for item in preset.items.all()]
+        preset.save(update_fields=['item_ids'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('potatoes', '0002_equipped_items_and_preset_items'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            move_item_ids_to_preset_items, move_preset_items_to_item_ids
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1 on 2026-10-19 18:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('potatoes', '0003_move_preset_item_ids'),
+    ]
+
+    operations = [
+        # 되돌릴 때 기존 프리셋 행에 빈 배열로 다시 추가되도록 기본값을 지정한 뒤 제거
+        migrations.AlterField(
+            model_name='userpreset',
+            name='item_ids',
+            field=models.JSONField(default=list),
+        ),
+        migrations.RemoveField(
+            model_name='userpreset',
+            name='item_ids',
+        ),
+    ]
@@ -1,6 +1,6 @@
 from common.models import TimeStampModel
 from django.conf import settings
-from django.db import models
+from django.db import models, transaction
 from items.models import Item
 
 
@@ -30,13 +30,67 @@ class Potato(TimeStampModel):
         default_skin_item = Item.objects.filter(item_type="skin").first()
         return cls.objects.create(user=user, skin_item=default_skin_item)
 
+    # 아이템 착용 (종류별로 하나씩, 스킨은 skin_item 에 저장하고 나머지는 슬롯을 교체)
+    @transaction.atomic
+    def equip_items(self, items):
+        slots = {item.item_type: item for item in items}
+        skin_item = slots.pop("skin", None)
+        if skin_item is not None:
+            self.skin_item = skin_item
+            self.save(update_fields=["skin_item", "updated_at"])
+
+        self.equipped_items.all().delete()
+        PotatoEquippedItem.objects.bulk_create(
+            [
+                PotatoEquippedItem(potato=self, slot=slot, item=item)
+                for slot, item in slots.items()
+            ]
+        )
+
+
+class PotatoEquippedItem(TimeStampModel):
+    # 감자가 착용 중인 아이템. 아이템 종류(slot)마다 하나만 착용할 수 있다.
+    potato = models.ForeignKey(
+        Potato, on_delete=models.CASCADE, related_name="equipped_items"
+    )
+    slot = models.CharField(max_length=50)
+    item = models.ForeignKey(
+        Item, on_delete=models.CASCADE, related_name="equipped_potatoes"
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["potato", "slot"], name="unique_potato_equipped_slot"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.potato} wears {self.item} ({self.slot})"
+
 
 class UserPreset(TimeStampModel):
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="presets"
     )
     preset_name = models.CharField(max_length=50)
-    item_ids = models.JSONField()  # 아이템 ID 배열을 JSON 필드로 저장
+    items = models.ManyToManyField(
+        Item, through="UserPresetItem", related_name="presets", blank=True
+    )
 
     def __str__(self):
         return f"{self.user}'s Preset: {self.preset_name}"
+
+
+class UserPresetItem(models.Model):
+    preset = models.ForeignKey(
+        UserPreset, on_delete=models.CASCADE, related_name="preset_items"
+    )
+    item = models.ForeignKey(Item, on_delete=models.CASCADE, related_name="+")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["preset", "item"], name="unique_user_preset_item"
+            ),
+        ]
@@ -1,9 +1,11 @@
-from drf_spectacular.types import OpenApiTypes
+from collections import defaultdict
+
+from django.db import transaction
 from drf_spectacular.utils import extend_schema_field
 from items.models import Item
 from rest_framework import serializers
 
-from .models import Potato, UserPreset
+from .models import Potato, PotatoEquippedItem, UserPreset, UserPresetItem
 
 
 # 아이템 직렬화
@@ -13,13 +15,23 @@ class PotatoItemSerializer(serializers.ModelSerializer):
         fields = ["id", "name", "description", "price", "item_type"]
 
 
+# 감자가 착용 중인 아이템
+class PotatoEquippedItemSerializer(serializers.ModelSerializer):
+    item = PotatoItemSerializer(read_only=True)
+
+    class Meta:
+        model = PotatoEquippedItem
+        fields = ["slot", "item"]
+
+
 # 감자 조회 및 수정
 class UserPotatoSerializer(serializers.ModelSerializer):
     skin_item = PotatoItemSerializer(read_only=True)  # 스킨 아이템의 상세 정보는 아이템시리얼라이저에서참조
+    equipped_items = PotatoEquippedItemSerializer(many=True, read_only=True)
 
     class Meta:
         model = Potato
-        fields = ["id", "user", "skin_item", "created_at", "updated_at"]
+        fields = ["id", "user", "skin_item", "equipped_items", "created_at", "updated_at"]
         read_only_fields = ["id", "user", "created_at", "updated_at"]
 
     def update(self, instance, validated_data):
@@ -30,29 +42,77 @@ class UserPotatoSerializer(serializers.ModelSerializer):
         return instance
 
 
+# 프리셋 아이템 ID 목록 (응답에는 prefetch 된 items 를 사용)
+class PresetItemIdsMixin(serializers.Serializer):
+    item_ids = serializers.ListField(child=serializers.IntegerField(), write_only=True)
+
+    def validate_item_ids(self, value):
+        # 존재하는 아이템인지, 종류가 겹치지 않는지 한 번의 쿼리로 확인
+        item_ids = list(dict.fromkeys(value))
+        item_types = dict(
+            Item.objects.filter(id__in=item_ids).values_list("id", "item_type")
+        )
+        missing_ids = [item_id for item_id in item_ids if item_id not in item_types]
+        if missing_ids:
+            raise serializers.ValidationError(
+                f"존재하지 않는 아이템입니다: {missing_ids}"
+            )
+
+        # 종류별로 하나씩만 착용할 수 있으므로 같은 종류의 아이템이 여러 개면 거부
+        ids_by_type = defaultdict(list)
+        for item_id in item_ids:
+            ids_by_type[item_types[item_id]].append(item_id)
+        duplicated = {
+            item_type: ids for item_type, ids in ids_by_type.items() if len(ids) > 1
+        }
+        if duplicated:
+            raise serializers.ValidationError(
+                f"같은 종류의 아이템은 하나만 선택할 수 있습니다: {duplicated}"
+            )
+        return item_ids
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        data["item_ids"] = [item.id for item in instance.items.all()]
+        return data
+
+    @staticmethod
+    def set_items(preset, item_ids):
+        UserPresetItem.objects.filter(preset=preset).exclude(
+            item_id__in=item_ids
+        ).delete()
+        UserPresetItem.objects.bulk_create(
+            [UserPresetItem(preset=preset, item_id=item_id) for item_id in item_ids],
+            ignore_conflicts=True,
+        )
+
+
 # 전체 프리셋 리스트 조회
 class UserPotatoPresetListSerializer(serializers.ModelSerializer):
+    item_ids = serializers.SerializerMethodField()
+
     class Meta:
         model = UserPreset
         fields = ["id", "preset_name", "item_ids", "created_at"]
 
+    @extend_schema_field(serializers.ListField(child=serializers.IntegerField()))
+    def get_item_ids(self, obj):
+        return [item.id for item in obj.items.all()]
+
 
 # 특정 프리셋 상세 조회
 class UserPotatoPresetDetailSerializer(serializers.ModelSerializer):
-    item_details = serializers.SerializerMethodField()
+    item_details = PotatoItemSerializer(source="items", many=True, read_only=True)
 
     class Meta:
         model = UserPreset
         fields = ["id", "preset_name", "item_details", "created_at"]
 
-    @extend_schema_field(OpenApiTypes.OBJECT)
-    def get_item_details(self, obj):
-        items = Item.objects.filter(id__in=obj.item_ids)
-        return PotatoItemSerializer(items, many=True).data
-
 
 # 프리셋 생성
-class UserPotatoPresetCreateSerializer(serializers.ModelSerializer):
+class UserPotatoPresetCreateSerializer(
+    PresetItemIdsMixin, serializers.ModelSerializer
+):
     class Meta:
         model = UserPreset
         fields = ["preset_name", "item_ids"]
@@ -65,21 +125,29 @@ class UserPotatoPresetCreateSerializer(serializers.ModelSerializer):
         return data
 
     # 프리셋 DB 저장
+    @transaction.atomic
     def create(self, validated_data):
-        user = self.context["request"].user
-        return UserPreset.objects.create(user=user, **validated_data)
+        validated_data.setdefault("user", self.context["request"].user)
+        item_ids = validated_data.pop("item_ids")
+        preset = UserPreset.objects.create(**validated_data)
+        self.set_items(preset, item_ids)
+        return preset
 
 
 # 프리셋 수정 및 삭제
-class UserPotatoPresetUpdateSerializer(serializers.ModelSerializer):
+class UserPotatoPresetUpdateSerializer(
+    PresetItemIdsMixin, serializers.ModelSerializer
+):
     class Meta:
         model = UserPreset
         fields = ["preset_name", "item_ids"]
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         instance.preset_name = validated_data.get("preset_name", instance.preset_name)
-        instance.item_ids = validated_data.get("item_ids", instance.item_ids)
         instance.save()
+        if "item_ids" in validated_data:
+            self.set_items(instance, validated_data["item_ids"])
         return instance
 
 
@@ -87,21 +155,19 @@ class UserPotatoPresetUpdateSerializer(serializers.ModelSerializer):
 class UserPotatoPresetApplySerializer(serializers.Serializer):
     preset_id = serializers.IntegerField()
 
-    def validate_preset_id(self, value):
+    def validate(self, data):
         user = self.context["request"].user
-        preset = UserPreset.objects.filter(id=value, user=user).first()
+        # 프리셋과 아이템을 한 번에 조회해서 검증과 적용에 함께 사용
+        preset = (
+            UserPreset.objects.filter(id=data["preset_id"], user=user)
+            .prefetch_related("items")
+            .first()
+        )
         if not preset:
             raise serializers.ValidationError("해당 프리셋이 존재하지 않거나 권한이 없습니다.")
 
         # 프리셋에 포함된 아이템 유효성 확인
-        if not Item.objects.filter(id__in=preset.item_ids).exists():
+        if not preset.items.all():
             raise serializers.ValidationError("프리셋에 유효한 아이템이 포함되어 있지 않습니다.")
-        return value
-
-    def save(self):
-        user = self.context["request"].user
-        preset = UserPreset.objects.get(id=self.validated_data["preset_id"], user=user)
-        potato = Potato.objects.get(user=user)
-        potato.skin_item = Item.objects.get(id=preset.item_ids[0])  # 예: 첫 번째 아이템만 적용
-        potato.save()
-        return potato
+        data["preset"] = preset
+        return data
@@ -0,0 +1,103 @@
+import hashlib
+from io import BytesIO
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from items.services import ItemCatalogService
+from PIL import Image
+
+from .models import Potato
+
+
+class PotatoRenderService:
+    """
+    감자 스킨과 착용 아이템 이미지를 하나의 WebP 이미지로 합성한다.
+    결과 파일은 착용 아이템 조합의 해시로 저장하므로 같은 조합은 한 번만 렌더링하고,
+    사용자 → 렌더 URL 매핑만 캐시에 둔다.
+    """
+
+    RENDER_KEY = "potato_render:{version}:{user_id}"
+    RENDER_PATH = "potatoes/renders/{digest}.webp"
+    # 합성 방식이 바뀌면 올려서 기존 렌더 파일을 재사용하지 않도록 함
+    RENDER_VERSION = 1
+    # 아래에 깔리는 레이어부터 그린다. 나머지 아이템은 종류, ID 순서
+    LAYER_ORDER = {"skin": 0}
+
+    @staticmethod
+    def get_equipped_items(potato):
+        items = [equipped.item for equipped in potato.equipped_items.all()]
+        return [potato.skin_item, *items] if potato.skin_item else items
+
+    @classmethod
+    def get_render_key(cls, user_id):
+        # 아이템이 바뀌면 카탈로그 버전이 올라가므로 모든 사용자의 매핑이 함께 무효화된다.
+        version = ItemCatalogService.catalog.get_version()
+        return cls.RENDER_KEY.format(version=version, user_id=user_id)
+
+    @classmethod
+    def get_render_url(cls, user_id):
+        key = cls.get_render_key(user_id)
+        url = cache.get(key)
+        if url is not None:
+            return url
+
+        potato = (
+            Potato.objects.select_related("skin_item")
+            .prefetch_related("equipped_items__item")
+            .filter(user_id=user_id)
+            .first()
+        )
+        if potato is None:
+            return None
+        layers = sorted(
+            (item for item in cls.get_equipped_items(potato) if item.image),
+            key=lambda item: (
+                cls.LAYER_ORDER.get(item.item_type, 1),
+                item.item_type,
+                item.id,
+            ),
+        )
+        if not layers:
+            return None
+
+        name = cls.RENDER_PATH.format(digest=cls.get_digest(layers))
+        if not default_storage.exists(name):
+            name = default_storage.save(name, ContentFile(cls.compose(layers)))
+        url = default_storage.url(name)
+        cache.set(key, url, timeout=settings.POTATO_RENDER_CACHE_TIMEOUT)
+        return url
+
+    @classmethod
+    def get_digest(cls, layers):
+        # 아이템 이미지가 같은 이름으로 다시 올라와도 구분되도록 수정 시간을 포함
+        source = "|".join(
+            f"{item.id}:{item.image.name}:{item.updated_at.timestamp()}"
+            for item in layers
+        )
+        return hashlib.sha256(f"{cls.RENDER_VERSION}|{source}".encode()).hexdigest()
+
+    @staticmethod
+    def compose(layers):
+        canvas = None
+        for item in layers:
+            with item.image.open("rb") as image_file:
+                layer = Image.open(image_file).convert("RGBA")
+            if canvas is None:
+                # 가장 아래 레이어(스킨) 크기를 기준으로 합성
+                canvas = layer
+                continue
+            if layer.size != canvas.size:
+                layer = layer.resize(canvas.size, Image.LANCZOS)
+            canvas.alpha_composite(layer)
+
+        buffer = BytesIO()
+        canvas.save(buffer, format="WEBP", quality=90)
+        return buffer.getvalue()
+
+    @classmethod
+    def invalidate(cls, user_id):
+        # 착용 아이템이 바뀐 트랜잭션이 커밋된 뒤 사용자 → 렌더 URL 매핑 삭제
+        transaction.on_commit(lambda: cache.delete(cls.get_render_key(user_id)))
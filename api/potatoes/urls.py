@@ -1,6 +1,7 @@
 from django.urls import path
 
 from .views import (
+    PotatoRenderView,
     UserPotatoPresetApplyView,
     UserPotatoPresetCreateView,
     UserPotatoPresetDetailView,
@@ -11,6 +12,7 @@ from .views import (
 
 urlpatterns = [
     path("", UserPotatoView.as_view(), name="user_potato_info"),
+    path("render/<int:user_id>/", PotatoRenderView.as_view(), name="potato_render"),
     path("preset/", UserPotatoPresetListView.as_view(), name="user_potato_list"),
     path(
         "preset/create/",
@@ -1,9 +1,10 @@
+from django.http import HttpResponseRedirect
 from django.shortcuts import get_object_or_404
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiParameter, OpenApiResponse, extend_schema
 from items.models import Item
 from rest_framework import generics, status
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
@@ -16,6 +17,7 @@ from .serializers import (
     UserPotatoPresetUpdateSerializer,
     UserPotatoSerializer,
 )
+from .services import PotatoRenderService
 
 
 # 감자 조회 및 수정
@@ -34,7 +36,10 @@ class UserPotatoView(generics.GenericAPIView):
     )
     def get(self, request):
         potato = get_object_or_404(
-            Potato.objects.select_related("skin_item"), user=request.user
+            Potato.objects.select_related("skin_item").prefetch_related(
+                "equipped_items__item"
+            ),
+            user=request.user,
         )
         serializer = self.get_serializer(potato)
         return Response(serializer.data)
@@ -52,14 +57,50 @@ class UserPotatoView(generics.GenericAPIView):
     )
     def put(self, request):
         potato = get_object_or_404(
-            Potato.objects.select_related("skin_item"), user=request.user
+            Potato.objects.select_related("skin_item").prefetch_related(
+                "equipped_items__item"
+            ),
+            user=request.user,
         )
         serializer = self.get_serializer(potato, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
         serializer.save()
+        PotatoRenderService.invalidate(request.user.id)
         return Response(serializer.data)
 
 
+# 감자 합성 이미지
+@extend_schema(
+    tags=["potato"],
+    summary="감자 이미지 조회",
+    description="사용자의 스킨과 착용 아이템을 하나로 합성한 감자 이미지(WebP)로 리다이렉트합니다.",
+    parameters=[
+        OpenApiParameter(
+            name="user_id",
+            description="감자 주인의 사용자 ID",
+            required=True,
+            type=OpenApiTypes.INT,
+            location=OpenApiParameter.PATH,
+        ),
+    ],
+    responses={
+        302: OpenApiResponse(description="합성된 감자 이미지 URL로 이동"),
+        404: OpenApiResponse(description="감자 또는 착용 아이템 이미지가 없습니다."),
+    },
+)
+class PotatoRenderView(APIView):
+    permission_classes = [AllowAny]
+
+    def get(self, request, user_id):
+        url = PotatoRenderService.get_render_url(user_id)
+        if url is None:
+            return Response(
+                {"error": "감자 이미지를 찾을 수 없습니다."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return HttpResponseRedirect(url)
+
+
 #  프리셋 리스트 조회
 @extend_schema(
     summary="사용자의 모든 프리셋 조회",
@@ -73,7 +114,7 @@ class UserPotatoPresetListView(generics.ListAPIView):
 
     def get_queryset(self):
         user = self.request.user
-        return UserPreset.objects.filter(user=user).prefetch_related("item_ids")
+        return UserPreset.objects.filter(user=user).prefetch_related("items")
 
 
 # 특정 프리셋 상세 조회
@@ -95,7 +136,7 @@ class UserPotatoPresetDetailView(generics.RetrieveAPIView):
 
     def get_queryset(self):
         user = self.request.user
-        return UserPreset.objects.filter(user=user).prefetch_related("item_ids")
+        return UserPreset.objects.filter(user=user).prefetch_related("items")
 
 
 # 프리셋 생성
@@ -120,7 +161,8 @@ class UserPotatoPresetCreateView(generics.CreateAPIView):
     summary="사용자의 프리셋 수정 (아이템 추가 및 삭제)",
     description=(
         "사용자의 프리셋을 수정합니다. 새로운 item_ids를 제공하면 기존 아이템과 "
-        "합쳐지거나 덮어씌워집니다. 빈 배열을 전달하면 아이템이 모두 삭제됩니다."
+        "합쳐지며, 같은 종류의 기존 아이템은 새 아이템으로 교체됩니다. "
+        "빈 배열을 전달하면 아이템이 모두 삭제됩니다."
     ),
     parameters=[
         OpenApiParameter(
@@ -146,7 +188,7 @@ class UserPotatoPresetUpdateView(generics.GenericAPIView):
 
     def get_queryset(self):
         user = self.request.user
-        return UserPreset.objects.filter(user=user)
+        return UserPreset.objects.filter(user=user).prefetch_related("items")
 
     def patch(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -158,15 +200,27 @@ class UserPotatoPresetUpdateView(generics.GenericAPIView):
                 # 빈 배열이 전달되면 아이템 모두 삭제
                 request.data["item_ids"] = []
             else:
-                existing_item_ids = instance.item_ids or []
-                merged_item_ids = list(set(existing_item_ids + new_item_ids))
+                # 종류(슬롯)마다 하나만 담을 수 있으므로 새 아이템과 같은 종류의 기존 아이템은 교체
+                new_item_types = set(
+                    Item.objects.filter(
+                        id__in=[i for i in new_item_ids if isinstance(i, int)]
+                    ).values_list("item_type", flat=True)
+                )
+                existing_item_ids = [
+                    item.id
+                    for item in instance.items.all()
+                    if item.item_type not in new_item_types
+                ]
+                merged_item_ids = list(dict.fromkeys(existing_item_ids + new_item_ids))
                 request.data["item_ids"] = merged_item_ids
 
         serializer = self.get_serializer(instance, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
-        self.perform_update(serializer)
+        serializer.save()
+        # 변경된 아이템 목록으로 응답하도록 다시 조회
+        instance = self.get_queryset().get(pk=instance.pk)
 
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        return Response(self.get_serializer(instance).data, status=status.HTTP_200_OK)
 
 
 # 프리셋 적용
@@ -198,29 +252,14 @@ class UserPotatoPresetApplyView(APIView):
             data=request.data, context={"request": request}
         )
         serializer.is_valid(raise_exception=True)
-        preset_id = serializer.validated_data["preset_id"]
+        preset = serializer.validated_data["preset"]
 
         user = request.user
-        potato = (
-            Potato.objects.select_related("user")
-            .prefetch_related("applied_items")
-            .get(user=user)
-        )
-        preset = get_object_or_404(
-            UserPreset.objects.prefetch_related("user"), id=preset_id, user=user
-        )
-
-        item_ids = preset.item_ids
-        items = Item.objects.filter(id__in=item_ids)
-
-        if not items.exists():
-            return Response(
-                {"error": "프리셋에 유효한 아이템이 없습니다."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
+        potato = get_object_or_404(Potato, user=user)
+        items = list(preset.items.all())
 
-        potato.applied_items.set(items)
-        potato.save()
+        potato.equip_items(items)
+        PotatoRenderService.invalidate(user.id)
 
         return Response(
             {
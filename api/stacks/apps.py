@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class StacksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'stacks'
+
+    def ready(self):
+        import stacks.signals
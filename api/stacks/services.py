@@ -0,0 +1,15 @@
+from common.catalog_cache import CatalogCache
+
+from .models import Stack
+from .serializers import StackSerializer
+
+
+class StackCatalogService:
+    # 기술 스택 목록은 거의 바뀌지 않으므로 직렬화 결과를 공유 캐시에 보관
+    catalog = CatalogCache("stacks")
+
+    @classmethod
+    def get_catalog(cls):
+        return cls.catalog.get(
+            lambda: StackSerializer(Stack.objects.order_by("id"), many=True).data
+        )
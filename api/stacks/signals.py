@@ -0,0 +1,12 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Stack
+from .services import StackCatalogService
+
+
+# 기술 스택이 추가/수정/삭제되면 스택 목록 캐시 버전을 올립니다.
+@receiver([post_save, post_delete], sender=Stack)
+def bump_stack_catalog(sender, **kwargs):
+    transaction.on_commit(StackCatalogService.catalog.bump)
@@ -1,11 +1,19 @@
+from common.conditional import conditional_get
+from django.http import HttpResponse
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import OpenApiExample, extend_schema
 from rest_framework import generics, status
 
 from .models import Stack
 from .serializers import StackSerializer
+from .services import StackCatalogService
 
 
+def stack_list_etag(request):
+    return StackCatalogService.get_catalog()["etag"]
+
+
+@conditional_get(etag_func=stack_list_etag)
 class StackListView(generics.ListAPIView):
     queryset = Stack.objects.all()
     serializer_class = StackSerializer
@@ -47,4 +55,8 @@ class StackListView(generics.ListAPIView):
         ],
     )
     def get(self, request, *args, **kwargs):
-        return super().get(request, *args, **kwargs)
+        # 캐시에 저장된 JSON을 다시 직렬화하지 않고 그대로 반환
+        return HttpResponse(
+            StackCatalogService.get_catalog()["content"],
+            content_type="application/json",
+        )
@@ -89,14 +89,32 @@ class User(AbstractBaseUser, PermissionsMixin, TimeStampModel):
     user_exp = models.PositiveIntegerField(null=False, default=0)
     total_coins = models.PositiveIntegerField(default=0)
 
+    # 팔로워/팔로잉 수는 follows 앱에서 update() 로만 갱신한다.
+    FOLLOW_COUNT_FIELDS = ("followers_count", "following_count")
+
     def increase_exp(self, amount):
         self.user_exp += amount
         self.user_tier = calculate_user_tier(self.user_exp)
-        self.save()
+        self.save(update_fields=["user_exp", "user_tier", "updated_at"])
 
     def update_total_coins(self):
         self.total_coins = self.coins.aggregate(total=models.Sum("coins"))["total"] or 0
-        self.save()
+        self.save(update_fields=["total_coins", "updated_at"])
+
+    def save(self, *args, **kwargs):
+        # 기존 사용자를 저장할 때 메모리에 있던 오래된 팔로워/팔로잉 수로
+        # DB 값을 덮어쓰지 않도록 카운터 컬럼을 저장 대상에서 제외한다.
+        # .only()/.defer() 로 불러오지 않은 컬럼도 Django 기본 동작처럼 제외한다.
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            deferred_fields = self.get_deferred_fields()
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key
+                and field.attname not in deferred_fields
+                and field.name not in self.FOLLOW_COUNT_FIELDS
+            ]
+        super().save(*args, **kwargs)
 
     # Permissions Mixin : 유저의 권한 관리
     is_active = models.BooleanField(default=True)
@@ -1,3 +1,4 @@
+from django.conf import settings
 from rest_framework import serializers
 from stacks.models import Stack, UserStack
 from stacks.serializers import StackSerializer
@@ -62,3 +63,46 @@ class UserProfileSerializer(serializers.ModelSerializer):
             "user_exp",
             "total_coins",
         ]
+
+
+class ProfileCardQuerySerializer(serializers.Serializer):
+    ids = serializers.CharField(
+        required=False, help_text="쉼표로 구분한 사용자 ID 목록 (예: 1,2,3)"
+    )
+    nicknames = serializers.CharField(
+        required=False, help_text="쉼표로 구분한 닉네임 목록"
+    )
+
+    def validate_ids(self, value):
+        try:
+            return [int(user_id) for user_id in value.split(",") if user_id.strip()]
+        except ValueError:
+            raise serializers.ValidationError("사용자 ID는 숫자여야 합니다.")
+
+    def validate_nicknames(self, value):
+        return [nickname.strip() for nickname in value.split(",") if nickname.strip()]
+
+    def validate(self, attrs):
+        count = len(attrs.get("ids", [])) + len(attrs.get("nicknames", []))
+        if count == 0:
+            raise serializers.ValidationError("ids 또는 nicknames 를 입력해주세요.")
+        if count > settings.PROFILE_CARD_MAX_USERS:
+            raise serializers.ValidationError(
+                f"한 번에 최대 {settings.PROFILE_CARD_MAX_USERS}명까지 조회할 수 있습니다."
+            )
+        return attrs
+
+
+class TodayActivitySerializer(serializers.Serializer):
+    attended = serializers.BooleanField()
+    til_count = serializers.IntegerField()
+
+
+class ProfileCardSerializer(serializers.Serializer):
+    user_id = serializers.IntegerField()
+    nickname = serializers.CharField()
+    profile_image = serializers.CharField(allow_null=True)
+    user_tier = serializers.CharField()
+    user_exp = serializers.IntegerField()
+    potato_image = serializers.CharField()
+    today_activity = TodayActivitySerializer()
@@ -1,4 +1,13 @@
 import requests
+from attendances.models import Attendance
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count
+from django.urls import reverse
+from django.utils import timezone
+from TILs.models import TIL
+
+from .models import User
 
 
 class SocialLoginService:
@@ -56,3 +65,87 @@ class SocialLoginCallbackService:
         user_info_data = user_info_response.json()
 
         return user_info_data
+
+
+class ProfileCardService:
+    """
+    목록 화면(팔로우, 검색, 방명록 등)에서 여러 사용자를 한 번에 보여주기 위한 프로필 카드.
+    카드는 사용자별로 짧게 캐시하고, 캐시에 없는 사용자만 모아서 고정된 수의 쿼리로 만든다.
+    """
+
+    CARD_KEY = "profile_card:{date}:{user_id}"
+
+    @classmethod
+    def get_cards(cls, user_ids=(), nicknames=()):
+        """
+        요청한 순서대로 카드 목록을 반환한다. 존재하지 않는 사용자는 제외한다.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        if nicknames:
+            ids_by_nickname = dict(
+                User.objects.filter(nickname__in=nicknames).values_list(
+                    "nickname", "id"
+                )
+            )
+            user_ids += [
+                ids_by_nickname[nickname]
+                for nickname in dict.fromkeys(nicknames)
+                if nickname in ids_by_nickname
+                and ids_by_nickname[nickname] not in user_ids
+            ]
+        if not user_ids:
+            return []
+
+        # 오늘 활동이 포함되므로 날짜가 바뀌면 다른 키를 사용
+        today = timezone.localdate()
+        keys = {
+            user_id: cls.CARD_KEY.format(date=today, user_id=user_id)
+            for user_id in user_ids
+        }
+        cached = cache.get_many(keys.values())
+        cards = {user_id: cached[key] for user_id, key in keys.items() if key in cached}
+
+        missing_ids = [user_id for user_id in user_ids if user_id not in cards]
+        if missing_ids:
+            built = cls.build_cards(missing_ids, today)
+            cache.set_many(
+                {keys[user_id]: card for user_id, card in built.items()},
+                timeout=settings.PROFILE_CARD_CACHE_TIMEOUT,
+            )
+            cards.update(built)
+
+        return [cards[user_id] for user_id in user_ids if user_id in cards]
+
+    @staticmethod
+    def build_cards(user_ids, today):
+        users = User.objects.filter(id__in=user_ids, is_active=True).only(
+            "id", "nickname", "profile_url", "user_tier", "user_exp"
+        )
+        attended_ids = set(
+            Attendance.objects.filter(user_id__in=user_ids, date=today).values_list(
+                "user_id", flat=True
+            )
+        )
+        til_counts = dict(
+            TIL.objects.filter(user_id__in=user_ids, created_at__date=today)
+            .values("user_id")
+            .annotate(count=Count("id"))
+            .values_list("user_id", "count")
+        )
+
+        return {
+            user.id: {
+                "user_id": user.id,
+                "nickname": user.nickname,
+                "profile_image": user.profile_url,
+                "user_tier": user.user_tier,
+                "user_exp": user.user_exp,
+                # 감자 합성 이미지는 렌더 엔드포인트가 리다이렉트로 제공
+                "potato_image": reverse("potato_render", args=[user.id]),
+                "today_activity": {
+                    "attended": user.id in attended_ids,
+                    "til_count": til_counts.get(user.id, 0),
+                },
+            }
+            for user in users
+        }
@@ -11,6 +11,11 @@ urlpatterns = [
         user_profile_views.MyProfileDetailView.as_view(),
         name="My-Profile",
     ),
+    path(
+        "profile-cards/",
+        user_profile_views.ProfileCardListView.as_view(),
+        name="Profile-Cards",
+    ),
     path(
         "profile/<str:nickname>/",
         user_profile_views.UserProfileDetailView.as_view(),
@@ -1,7 +1,13 @@
 import re
 
+from common.conditional import conditional_get, make_etag
 from django.shortcuts import get_object_or_404
-from drf_spectacular.utils import OpenApiExample, OpenApiResponse, extend_schema
+from drf_spectacular.utils import (
+    OpenApiExample,
+    OpenApiParameter,
+    OpenApiResponse,
+    extend_schema,
+)
 from rest_framework import generics, status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
@@ -9,9 +15,12 @@ from stacks.models import Stack, UserStack
 from users.models import User
 from users.serializers.user_profile_serializers import (
     NicknameSerializer,
+    ProfileCardQuerySerializer,
+    ProfileCardSerializer,
     UserProfileSerializer,
     UserStackSerializer,
 )
+from users.services import ProfileCardService
 
 
 # 사용자 기술스택 선택 뷰
@@ -159,6 +168,20 @@ class ChangeNicknameView(generics.GenericAPIView):
         return Response({"nickname": new_nickname}, status=status.HTTP_200_OK)
 
 
+def my_profile_etag(request):
+    # 인증 단계에서 이미 조회한 사용자 정보로 계산하므로 추가 쿼리가 없다.
+    return make_etag(request.user.id, request.user.updated_at)
+
+
+def user_profile_etag(request, nickname):
+    updated_at = (
+        User.objects.filter(nickname=nickname)
+        .values_list("updated_at", flat=True)
+        .first()
+    )
+    return make_etag(nickname, updated_at)
+
+
 # 본인 프로필 조회 뷰
 @extend_schema(
     tags=["info"],
@@ -166,6 +189,7 @@ class ChangeNicknameView(generics.GenericAPIView):
     description="로그인한 사용자의 프로필 정보를 조회합니다.",
     responses={status.HTTP_200_OK: UserProfileSerializer},
 )
+@conditional_get(etag_func=my_profile_etag)
 class MyProfileDetailView(generics.RetrieveAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = UserProfileSerializer
@@ -186,6 +210,7 @@ class MyProfileDetailView(generics.RetrieveAPIView):
     description="다른 사용자의 프로필 정보를 조회합니다.",
     responses={status.HTTP_200_OK: UserProfileSerializer},
 )
+@conditional_get(etag_func=user_profile_etag)
 class UserProfileDetailView(generics.RetrieveAPIView):
     permission_classes = [IsAuthenticated]
     serializer_class = UserProfileSerializer
@@ -195,3 +220,44 @@ class UserProfileDetailView(generics.RetrieveAPIView):
 
         serializer = self.get_serializer(profile)
         return Response(serializer.data, status=status.HTTP_200_OK)
+
+
+# 여러 사용자의 프로필 카드 조회 뷰
+@extend_schema(
+    tags=["info"],
+    summary="프로필 카드 일괄 조회",
+    description="여러 사용자의 티어, 경험치, 감자 이미지, 오늘 활동을 한 번에 조회합니다. 존재하지 않는 사용자는 결과에서 제외됩니다.",
+    parameters=[
+        OpenApiParameter(
+            name="ids",
+            description="쉼표로 구분한 사용자 ID 목록",
+            required=False,
+            type=str,
+        ),
+        OpenApiParameter(
+            name="nicknames",
+            description="쉼표로 구분한 닉네임 목록",
+            required=False,
+            type=str,
+        ),
+    ],
+    responses={
+        status.HTTP_200_OK: ProfileCardSerializer(many=True),
+        status.HTTP_400_BAD_REQUEST: OpenApiResponse(
+            description="조회할 사용자가 없거나 최대 인원을 초과했습니다."
+        ),
+    },
+)
+class ProfileCardListView(generics.GenericAPIView):
+    permission_classes = [IsAuthenticated]
+    serializer_class = ProfileCardSerializer
+
+    def get(self, request):
+        params = ProfileCardQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+
+        cards = ProfileCardService.get_cards(
+            user_ids=params.validated_data.get("ids", []),
+            nicknames=params.validated_data.get("nicknames", []),
+        )
+        return Response(cards, status=status.HTTP_200_OK)